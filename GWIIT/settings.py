@@ -12,6 +12,7 @@ https://docs.djangoproject.com/en/5.1/ref/settings/
 
 from pathlib import Path
 import atexit
+import sys
 import time
 import subprocess
 
@@ -178,36 +179,46 @@ DATABASES = {
 }
 '''
 
+# Every database must use a transactional backend (SQLite, PostgreSQL).
+# Tests rely on TestCase rolling each test back to a savepoint on each database.
+# Each TEST NAME ':memory:' keeps the test copy in memory, so schema creation and savepoints never hit disk.
+# organizations_db, sites_db and users_db set empty TEST DEPENDENCIES, so test classes may use them without 'default'.
 DATABASES = {
     # General fallback database
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'default.sqlite3',
+        'TEST': {'NAME': ':memory:'},
     },
     
     'authentication_db': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'authentication_db.sqlite3',
+        'TEST': {'NAME': ':memory:'},
     },
 
     'authorization_db': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'authorization_db.sqlite3',
+        'TEST': {'NAME': ':memory:'},
     },
 
     'organizations_db': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'organizations_db.sqlite3',
+        'TEST': {'NAME': ':memory:', 'DEPENDENCIES': []},
     },
 
     'sites_db': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'sites_db.sqlite3',
+        'TEST': {'NAME': ':memory:', 'DEPENDENCIES': []},
     },
 
     'users_db': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'users_db.sqlite3',
+        'TEST': {'NAME': ':memory:', 'DEPENDENCIES': []},
     },
 }
 
@@ -280,6 +291,36 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# True when running `python manage.py test`
+TESTING = len(sys.argv) > 1 and sys.argv[1] == 'test'
+
+# Full-strength PBKDF2 makes every make_password()/set_password() call in the test suite slow;
+# tests only need a hasher that round-trips, never a secure one.
+if TESTING:
+    PASSWORD_HASHERS = [
+        'django.contrib.auth.hashers.MD5PasswordHasher',
+    ]
+
+# Logging
+# https://docs.djangoproject.com/en/5.1/topics/logging/
+
+# App loggers write to the console at INFO and above; debug() calls are dropped before any formatting or output.
+# Lower 'users' to DEBUG to trace app, URL and view loading.
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+        },
+    },
+    'loggers': {
+        'users': {
+            'handlers': ['console'],
+            'level': 'INFO',
+        },
+    },
+}
 
 
 
@@ -0,0 +1,75 @@
+# Generated by Django 5.1.1 on 2026-10-17 02:49
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Organization',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=100, unique=True, verbose_name='Organization Name')),
+                ('type_id', models.IntegerField(blank=True, null=True, verbose_name='Type ID')),
+                ('active', models.BooleanField(default=True, verbose_name='Organization Active')),
+                ('contact_id', models.IntegerField(blank=True, null=True, verbose_name='Contact ID')),
+                ('login_options', models.JSONField(default=dict, verbose_name='Login Options')),
+                ('mfa_required', models.BooleanField(default=False, verbose_name='MFA Required')),
+                ('date_created', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Date Created')),
+                ('created_by_id', models.IntegerField(blank=True, null=True, verbose_name='Created By ID')),
+                ('last_modified', models.DateTimeField(auto_now=True, verbose_name='Last Modified')),
+                ('modified_by_id', models.IntegerField(blank=True, null=True, verbose_name='Modified By ID')),
+            ],
+            options={
+                'verbose_name': 'Organization',
+                'verbose_name_plural': 'Organizations',
+                'ordering': ['name', '-active', '-date_created'],
+            },
+        ),
+        migrations.CreateModel(
+            name='OrganizationContact',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('organization_id', models.IntegerField(blank=True, null=True, verbose_name='Organization ID')),
+                ('first_name', models.CharField(blank=True, max_length=30, null=True, verbose_name='First Name')),
+                ('last_name', models.CharField(blank=True, max_length=30, null=True, verbose_name='Last Name')),
+                ('email', models.EmailField(blank=True, max_length=254, null=True, verbose_name='Email Address')),
+                ('phone_number', models.CharField(blank=True, max_length=20, null=True, verbose_name='Phone Number')),
+                ('address', models.CharField(blank=True, max_length=255, null=True, verbose_name='Organization Mailing Address')),
+                ('role', models.CharField(blank=True, max_length=100, null=True, verbose_name='Role')),
+                ('date_created', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Date Created')),
+                ('created_by_id', models.IntegerField(blank=True, null=True, verbose_name='Created By ID')),
+                ('last_modified', models.DateTimeField(auto_now=True, verbose_name='Last Modified')),
+                ('modified_by_id', models.IntegerField(blank=True, null=True, verbose_name='Modified By ID')),
+            ],
+            options={
+                'verbose_name': 'Contact',
+                'verbose_name_plural': 'Contacts',
+                'ordering': ['last_name', 'first_name', 'organization_id', 'role', '-date_created'],
+            },
+        ),
+        migrations.CreateModel(
+            name='OrganizationType',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=50, unique=True, verbose_name='Type Name')),
+                ('description', models.TextField(blank=True, null=True, verbose_name='Type Description')),
+                ('date_created', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Date Created')),
+                ('created_by_id', models.IntegerField(blank=True, null=True, verbose_name='Created By ID')),
+                ('last_modified', models.DateTimeField(auto_now=True, verbose_name='Last Modified')),
+                ('modified_by_id', models.IntegerField(blank=True, null=True, verbose_name='Modified By ID')),
+            ],
+            options={
+                'verbose_name': 'Organization Type',
+                'verbose_name_plural': 'Organization Types',
+                'ordering': ['name'],
+            },
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 5.1.1 on 2026-10-17 02:49
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Contact',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('first_name', models.CharField(blank=True, max_length=30, null=True, verbose_name='First Name')),
+                ('last_name', models.CharField(blank=True, max_length=30, null=True, verbose_name='Last Name')),
+                ('email', models.EmailField(blank=True, db_index=True, max_length=254, null=True, verbose_name='Email Address')),
+                ('phone_number', models.CharField(blank=True, max_length=20, null=True, verbose_name='Phone Number')),
+                ('address', models.CharField(blank=True, max_length=255, null=True, verbose_name='Site Mailing Address')),
+                ('role', models.CharField(blank=True, max_length=100, null=True, verbose_name='Role')),
+                ('date_created', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Date Created')),
+                ('created_by_id', models.IntegerField(blank=True, null=True, verbose_name='Created By ID')),
+                ('last_modified', models.DateTimeField(auto_now=True, verbose_name='Last Modified')),
+                ('modified_by_id', models.IntegerField(blank=True, null=True, verbose_name='Modified By ID')),
+            ],
+            options={
+                'verbose_name': 'Contact',
+                'verbose_name_plural': 'Contacts',
+                'ordering': ['first_name', 'last_name', '-date_created'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Site',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('name', models.CharField(db_index=True, max_length=255, verbose_name='Site Name')),
+                ('organization_id', models.IntegerField(blank=True, null=True, verbose_name='Organization ID')),
+                ('site_type', models.CharField(blank=True, max_length=100, null=True, verbose_name='Site Type')),
+                ('address', models.CharField(blank=True, max_length=255, null=True, verbose_name='Site Address')),
+                ('active', models.BooleanField(default=True, verbose_name='Site Active')),
+                ('date_created', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Date Created')),
+                ('created_by_id', models.IntegerField(blank=True, null=True, verbose_name='Created By ID')),
+                ('last_modified', models.DateTimeField(auto_now=True, verbose_name='Last Modified')),
+                ('modified_by_id', models.IntegerField(blank=True, null=True, verbose_name='Modified By ID')),
+            ],
+            options={
+                'verbose_name': 'Site',
+                'verbose_name_plural': 'Sites',
+                'ordering': ['name', '-active', '-date_created'],
+            },
+        ),
+    ]
@@ -1,6 +1,9 @@
+import logging
 from django.apps import AppConfig
 from django.utils.translation import gettext_lazy as _
 
+logger = logging.getLogger(__name__)
+
 class UsersConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'users'
@@ -15,5 +18,5 @@ class UsersConfig(AppConfig):
     #     import users.signals
 
     def ready(self):
-        print("DEBUG: AppConfig ready() running for users app")
-        print("DEBUG: Users app initialization complete.")
\ No newline at end of file
+        logger.debug("AppConfig ready() running for users app")
+        logger.debug("Users app initialization complete.")
\ No newline at end of file
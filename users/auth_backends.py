@@ -1,7 +1,10 @@
+import logging
 from django.contrib.auth.backends import ModelBackend
 from django.db.models import Q
 from django.apps import apps
 
+logger = logging.getLogger(__name__)
+
 class MultiFieldModelBackend(ModelBackend):
     """
     Custom authentication backend that allows users to log in with 
@@ -24,20 +27,24 @@ class MultiFieldModelBackend(ModelBackend):
                 is_active=True  # Ensures only active users can log in
             ).first()
 
-            print(f"DEBUG: Found user: {user}")
+            logger.debug("Found user: %s", user)
 
         except User.DoesNotExist:
-            print("DEBUG: No matching user found")
+            logger.debug("No matching user found")
             return None  # No matching user found
 
         if user:
-            print(f"DEBUG: Checking password for {user.email}")
+            logger.debug("Checking password for %s", user.email)
         # Check the password
             if user.check_password(password):
-                print("DEBUG: Password check passed")
+                logger.debug("Password check passed")
                 return user  # Return authenticated user object
             else:
-                print("DEBUG: Password check failed")
+                logger.debug("Password check failed")
+        else:
+            # Run the default password hasher once anyway, so an unknown identifier takes as long
+            # as a wrong password and response time does not reveal which accounts exist
+            User().set_password(password)
         return None  # Authentication failed
 
     def user_can_authenticate(self, user):
@@ -55,9 +62,11 @@ class MultiFieldModelBackend(ModelBackend):
     def get_user(self, user_id):
         """
         Retrieves a user by their ID.
+        Runs on every authenticated request, so the MFA secret columns, which are only
+        needed while verifying a second factor, are deferred and loaded on first access.
         """
         try:
             User = apps.get_model("users", "User")
-            return User.objects.using("users_db").get(pk=user_id)
+            return User.objects.using("users_db").defer("static_otp", "mfa_secret").get(pk=user_id)
         except User.DoesNotExist:
             return None
@@ -1,6 +1,7 @@
 # import redis
 # import uuid
 # from django.conf import settings
+# from django.core.cache import cache
 # from django.http import JsonResponse
 # from functools import wraps
 
@@ -13,16 +14,41 @@
 #     redis_client.setex(f"session:{session_id}", 86400, user_id)  # Store in Redis (expires in 24 hours)
 #     return session_id
 
+# # Seconds a user row stays cached for authenticated GET requests
+# USER_CACHE_TIMEOUT = 60
+
+# def user_cache_key(user_id):
+#     """Cache key for a user row; shared with the invalidation receivers in users.signals"""
+#     return f"user:{user_id}"
+
+# def get_cached_user(user_id):
+#     """Returns the user from the cache, loading it from users_db on a miss"""
+#     from .models import User
+
+#     key = user_cache_key(user_id)
+#     user = cache.get(key)
+#     if user is None:
+#         # The MFA secrets are not needed to render pages, so they are neither loaded nor cached
+#         user = User.objects.using("users_db").defer("static_otp", "mfa_secret").get(pk=user_id)
+#         cache.set(key, user, timeout=USER_CACHE_TIMEOUT)
+#     return user
+
 # def custom_login_required(view_func):
 #     """Custom authentication decorator to check Redis session"""
 #     @wraps(view_func)
 #     def _wrapped_view(request, *args, **kwargs):
+#         # Already resolved earlier in this request (nested or stacked decorators); skip Redis
+#         if getattr(request, "user_id", None) is not None:
+#             return view_func(request, *args, **kwargs)
+
 #         session_id = request.COOKIES.get("session_id")  # Retrieve session from cookies
 
-#         if not session_id or not redis_client.exists(f"session:{session_id}"):
+#         # A single GET both checks the session exists and returns the user ID
+#         user_id = redis_client.get(f"session:{session_id}") if session_id else None
+#         if user_id is None:
 #             return JsonResponse({"error": "Authentication required"}, status=401)
 
-#         request.user_id = redis_client.get(f"session:{session_id}")  # Retrieve user ID
+#         request.user_id = user_id
 #         return view_func(request, *args, **kwargs)
 
 #     return _wrapped_view
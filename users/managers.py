@@ -79,6 +79,14 @@ class UserManager(models.Manager):
 
     SPECIAL_CHARACTERS = ["@", "#", "$", "%", "^", "&", "*", "(", ")", "-", "_", "+", "="]
 
+    # Human-readable names for the login identifiers, used in duplicate-identifier errors
+    IDENTIFIER_LABELS = {
+        "email": "email",
+        "username": "username",
+        "badge_barcode": "badge barcode",
+        "badge_rfid": "badge RFID",
+    }
+
     """
     Manually normalizes and validates email addresses.
         - Converts all characters to lowercase.
@@ -181,6 +189,57 @@ class UserManager(models.Manager):
 
         return password
     
+    """
+    Ensures no **active** user already holds any of the given login identifiers.
+
+    Key Behaviors:
+        - Runs a single query against 'users_db'; nothing is hashed or saved.
+        - Only identifiers that were actually provided are checked (a missing username is not a duplicate).
+        - Expects an already normalized email; other values are converted with each field's get_prep_value().
+        - `exclude_id` (the user being updated) is never counted as its own duplicate.
+
+    Raises:
+        ValueError: Naming the first identifier (email, username, badge barcode, badge RFID)
+            already held by an active user.
+    """
+
+    def _validate_unique_identifiers(self, email, username=None, badge_barcode=None, badge_rfid=None, exclude_id=None):
+
+        User = apps.get_model("users", "User")
+
+        identifiers = {
+            "email": email,
+            "username": username,
+            "badge_barcode": badge_barcode,
+            "badge_rfid": badge_rfid,
+        }
+        # Convert each value the way the query will (e.g. an int badge becomes "12345"),
+        # so the Python comparison below agrees with the SQL match
+        provided = {
+            field: User._meta.get_field(field).get_prep_value(value)
+            for field, value in identifiers.items() if value
+        }
+        if not provided:
+            return
+
+        matches_any = models.Q()
+        for field, value in provided.items():
+            matches_any |= models.Q(**{field: value})
+
+        # Fetch just the identifier columns of one clashing row so the error can name the field.
+        # order_by() drops Meta.ordering, which would otherwise sort the matches for no benefit.
+        candidates = User.objects.using("users_db").filter(matches_any, is_active=True)
+        if exclude_id is not None:
+            candidates = candidates.exclude(id=exclude_id)
+        duplicate = candidates.order_by().values(*provided)[:1]
+
+        for row in duplicate:
+            for field, value in provided.items():
+                if row[field] == value:
+                    raise ValueError(f"An active user with this {self.IDENTIFIER_LABELS[field]} already exists.")
+            # The database matched a row that no field compares equal to; still refuse the duplicate
+            raise ValueError("An active user with this email, username, or badge already exists.")
+
     """
     Creates a new user with the required fields and handles secure password generation, validation, 
         and email notification with login credentials.
@@ -198,7 +257,8 @@ class UserManager(models.Manager):
     Returns:
         tuple: (User instance, email_sent boolean flag)
     Raises:
-        ValueError: If required fields are missing, duplicate active user is found, or password is invalid.
+        ValueError: If required fields are missing, the password is blank, or an active user already holds
+            one of the identifiers. All of these are raised before any password hashing or database write.
     """
 
 
@@ -226,19 +286,17 @@ class UserManager(models.Manager):
         if "is_active" not in extra_fields:
             extra_fields["is_active"] = True
 
+        # Reject an explicitly blank password before any database work
+        if password is not None and (not isinstance(password, str) or password.strip() == ""):
+            raise ValueError("A valid password must be set and cannot be blank.")
 
         # Prevent duplicate login identifiers for **active** users
-        duplicate_active_user = User.objects.using("users_db").filter(
-            models.Q(is_active=True) & (
-                models.Q(email=extra_fields["email"]) |
-                models.Q(username=username) |
-                models.Q(badge_barcode=badge_barcode) |
-                models.Q(badge_rfid=badge_rfid)
-            )
-        ).exists()
-
-        if duplicate_active_user:
-            raise ValueError("An active user with this email, username, or badge already exists.")
+        self._validate_unique_identifiers(
+            email=extra_fields["email"],
+            username=username,
+            badge_barcode=badge_barcode,
+            badge_rfid=badge_rfid,
+        )
 
         # Extract manually managed foreign key IDs
         organization_id = extra_fields.pop("organization_id", None)
@@ -250,10 +308,6 @@ class UserManager(models.Manager):
         if password is None:
             password = self.generate_secure_password()
 
-        # Validate password after generation
-        if not password or not isinstance(password, str) or password.strip() == "":
-            raise ValueError("A valid password must be set and cannot be blank.")
-
         # Directly assign all user attributes BEFORE saving
         user = User(**extra_fields)
         user.username = username
@@ -370,30 +424,18 @@ class UserManager(models.Manager):
             ]):
                 raise ValueError("At least one login identifier (username, badge) must remain set.")
 
-            print(User.objects.using("users_db").values("id", "email", "is_active"))
-
-            # Prevent duplicate active users BEFORE saving to avoid IntegrityError
-            fields_to_check = ["email", "username", "badge_barcode", "badge_rfid"]
-            q_objects = models.Q(is_active=True)  # Ensure we're only checking active users
-
-            for field in fields_to_check:
-                new_value = updated_fields.get(field)
-                if new_value and new_value != getattr(user, field):  # Only check if field is changing
-                    q_objects &= models.Q(**{field: new_value})
-
-            # If at least one field is changing, check for conflicts
-            if any(updated_fields.get(field) for field in fields_to_check):
-                conflict_query = models.Q(is_active=True) & models.Q(
-                    models.Q(email=updated_fields.get("email")) |
-                    models.Q(username=updated_fields.get("username")) |
-                    models.Q(badge_barcode=updated_fields.get("badge_barcode")) |
-                    models.Q(badge_rfid=updated_fields.get("badge_rfid"))
-                )
-
-                existing_user = User.objects.using("users_db").filter(conflict_query).exclude(id=user.id).first()
-                                
-                if existing_user:
-                    raise ValueError("An active user with this email, username, or badge already exists.")
+            # Prevent duplicate active users BEFORE saving to avoid IntegrityError.
+            # Only identifiers that are set and changing are checked, so an unset (NULL) badge never counts as a match.
+            changed_identifiers = {
+                field: updated_fields[field]
+                for field in self.IDENTIFIER_LABELS
+                if updated_fields.get(field) and updated_fields[field] != getattr(user, field)
+            }
+            self._validate_unique_identifiers(
+                email=changed_identifiers.pop("email", None),
+                exclude_id=user.id,
+                **changed_identifiers,
+            )
 
             # Assign manually managed foreign key IDs
             if organization_id is not None:
@@ -0,0 +1,50 @@
+# Generated by Django 5.1.1 on 2026-10-17 03:22
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='User',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('email', models.EmailField(db_index=True, max_length=254, verbose_name='Email Address')),
+                ('username', models.CharField(blank=True, db_index=True, max_length=30, null=True, verbose_name='Username')),
+                ('password', models.CharField(max_length=128, verbose_name='Password')),
+                ('first_name', models.CharField(blank=True, db_index=True, max_length=30, null=True, verbose_name='First Name')),
+                ('last_name', models.CharField(blank=True, db_index=True, max_length=30, null=True, verbose_name='Last Name')),
+                ('badge_barcode', models.CharField(blank=True, db_index=True, max_length=100, null=True, verbose_name='Badge Barcode')),
+                ('badge_rfid', models.CharField(blank=True, db_index=True, max_length=100, null=True, verbose_name='Badge RFID')),
+                ('organization_id', models.IntegerField(blank=True, null=True, verbose_name='Organization ID')),
+                ('site_id', models.IntegerField(blank=True, null=True, verbose_name='Site ID')),
+                ('phone_number', models.CharField(blank=True, max_length=15, null=True, verbose_name='Phone Number')),
+                ('mfa_preference', models.CharField(choices=[('none', 'None'), ('google_authenticator', 'Google Authenticator'), ('sms', 'SMS'), ('email', 'Email'), ('static_otp', 'Static OTP')], default='none', max_length=50, verbose_name='MFA Preference')),
+                ('mfa_secret', models.CharField(blank=True, max_length=100, null=True, verbose_name='MFA Secret')),
+                ('static_otp', models.TextField(blank=True, null=True, verbose_name='Static OTP')),
+                ('is_active', models.BooleanField(default=True, verbose_name='Is Active')),
+                ('is_superuser', models.BooleanField(default=False, verbose_name='Is Superuser')),
+                ('is_staff', models.BooleanField(default=False, verbose_name='Is Staff')),
+                ('last_login', models.DateTimeField(blank=True, null=True, verbose_name='Last Login')),
+                ('date_joined', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Date Joined')),
+                ('date_created', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Date Created')),
+                ('created_by_id', models.IntegerField(blank=True, null=True, verbose_name='Created By ID')),
+                ('last_modified', models.DateTimeField(auto_now=True, verbose_name='Last Modified')),
+                ('modified_by_id', models.IntegerField(blank=True, null=True, verbose_name='Modified By ID')),
+            ],
+            options={
+                'verbose_name': 'User',
+                'verbose_name_plural': 'Users',
+                'ordering': ['email', 'username', 'first_name', 'last_name', 'badge_barcode', 'badge_rfid'],
+                'indexes': [models.Index(fields=['site_id', 'is_active'], name='user_site_active_idx'), models.Index(fields=['organization_id', 'is_active'], name='user_organization_active_idx'), models.Index(condition=models.Q(('is_staff', True)), fields=['is_staff'], name='user_staff_idx'), models.Index(fields=['date_joined'], name='user_date_joined_idx')],
+                'constraints': [models.UniqueConstraint(condition=models.Q(('is_active', True)), fields=('email',), name='unique_active_email'), models.UniqueConstraint(condition=models.Q(('is_active', True)), fields=('username',), name='unique_active_username'), models.UniqueConstraint(condition=models.Q(('is_active', True)), fields=('badge_barcode',), name='unique_active_badge_barcode'), models.UniqueConstraint(condition=models.Q(('is_active', True)), fields=('badge_rfid',), name='unique_active_badge_rfid')],
+            },
+        ),
+    ]
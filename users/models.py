@@ -147,6 +147,30 @@ class User(AbstractBaseUser):
             ),
         ]
 
+        """
+        Indexes for UserManager Filter Methods
+
+        Purpose:
+            - Back the site and organization filters (`from_site()`, `active_from_site()`,
+                `from_organization()`, `active_from_organization()`, etc.) with a composite index,
+                so the lookup is an index range instead of a table scan.
+            - Back `staff()`, `staff_from_site()`, and `staff_from_organization()` with a partial index
+                covering only staff users, which keeps it small since most users are not staff.
+            - Back the `recently_joined*()` methods with an index on `date_joined`, so the
+                `date_joined >= now - days` cutoff reads only the recent end of the index.
+
+        Key Considerations:
+            - The ID column leads each composite index, so it also serves filters on the ID alone.
+            - Partial indexes (`condition`) are supported by SQLite for development and PostgreSQL for production.
+        """
+
+        indexes = [
+            models.Index(fields=['site_id', 'is_active'], name='user_site_active_idx'),
+            models.Index(fields=['organization_id', 'is_active'], name='user_organization_active_idx'),
+            models.Index(fields=['is_staff'], condition=Q(is_staff=True), name='user_staff_idx'),
+            models.Index(fields=['date_joined'], name='user_date_joined_idx'),
+        ]
+
     """
     Computed Property: Full Name
         - Returns the full name of the user by combining `first_name` and `last_name`.
@@ -1,4 +1,6 @@
-# from django.db.models.signals import post_save, post_migrate
+# from django.db.models.signals import post_save, post_delete, post_migrate
+# from django.core.cache import cache
+# from .authentication import user_cache_key
 # from django.dispatch import receiver
 # from django.core.mail import send_mail
 # from django.contrib.auth.hashers import make_password
@@ -16,6 +18,12 @@
 #                 user.password = make_password(user.password)
 #                 user.save()
 
+# # Drops the cached copy used by get_cached_user() whenever a user is saved or deleted
+# @receiver(post_save, sender=User)
+# @receiver(post_delete, sender=User)
+# def invalidate_cached_user(sender, instance, **kwargs):
+#     cache.delete(user_cache_key(instance.pk))
+
 # # Decorator listens for the post_save signal on the User model
 # # @receiver(post_save, sender=User)
 # # def send_welcome_email(sender, instance, created, **kwargs):
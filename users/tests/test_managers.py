@@ -1,5 +1,6 @@
-from django.test import TestCase
-from django.apps import apps
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connections
+from django.test import SimpleTestCase, TestCase, override_settings
 from users.models import User
 from users.managers import UserManager
 from organizations.models import Organization
@@ -7,16 +8,173 @@ from sites.models import Site
 from django.utils.timezone import now
 from datetime import timedelta
 from django.core import mail
-from django.core.mail import send_mail
 from unittest.mock import patch
+import re
 import smtplib
-import time
 import string
-from django.contrib.auth import authenticate
-from django.contrib.auth.hashers import check_password
+from django.contrib.auth.hashers import make_password
+from contextlib import contextmanager
+from types import MappingProxyType
+from users import managers
 # https://docs.djangoproject.com/en/5.1/topics/testing/tools/
 
-class UserModelTests(TestCase):
+# Baseline create_user() arguments shared by the create_user tests; read-only so no test can alter another's defaults
+DEFAULT_USER_KWARGS = MappingProxyType({
+    "password": None,
+    "first_name": "Test",
+    "last_name": "User",
+    "created_by_id": None,
+})
+
+# Fixture rows for the DB-backed test classes, built once at import. References to other rows
+# (organization, site, created_by, modified_by) are tuple indexes resolved after each bulk insert.
+# login_options and mfa_required are left to their model defaults, so no mutable dict is shared between rows.
+_ORGANIZATION_ROWS = (
+    {"name": "Test Organization 1", "type_id": 1, "active": True, "contact_id": None,
+     "created_by_id": None, "modified_by_id": None},
+    {"name": "Test Organization 2", "type_id": 2, "active": True, "contact_id": None,
+     "created_by_id": None, "modified_by_id": None},
+)
+
+_SITE_ROWS = (
+    {"name": "Test Site 1", "organization": 0, "site_type": "Office", "address": "123 Test St",
+     "active": True, "created_by_id": None, "modified_by_id": None},
+    {"name": "Test Site 2", "organization": 1, "site_type": "Warehouse", "address": "456 Another St",
+     "active": True, "created_by_id": None, "modified_by_id": None},
+)
+
+_USER_ROWS = (
+    {"email": "user1@example.com", "username": "userone", "first_name": "Alice", "last_name": "Smith",
+     "organization": 0, "site": 0, "badge_barcode": "BARCODE12345", "badge_rfid": "RFID98765",
+     "is_active": True, "is_staff": False, "mfa_preference": "none",
+     "created_by": None, "modified_by": None, "age_days": 5},
+    {"email": "user2@example.com", "username": "usertwo", "first_name": "Bob", "last_name": "Johnson",
+     "organization": 0, "site": 0, "badge_barcode": "BARCODE23456", "badge_rfid": "RFID87654",
+     "is_active": False, "is_staff": False, "mfa_preference": "google_authenticator",
+     "created_by": None, "modified_by": 0, "age_days": 40},
+    {"email": "user3@example.com", "username": "userthree", "first_name": "Charlie", "last_name": "Brown",
+     "organization": None, "site": None, "badge_barcode": "BARCODE34567", "badge_rfid": "RFID76543",
+     "is_active": True, "is_staff": True, "mfa_preference": "sms",
+     "created_by": None, "modified_by": 0, "age_days": 15},
+    {"email": "user4@example.com", "username": "userfour", "first_name": "Dana", "last_name": "White",
+     "organization": None, "site": None, "badge_barcode": "BARCODE45678", "badge_rfid": "RFID65432",
+     "is_active": True, "is_staff": False, "mfa_preference": "email",
+     "created_by": 0, "modified_by": 1, "age_days": 0},
+)
+
+# Keys in _USER_ROWS that are resolved in _seed_fixtures() rather than passed to User()
+_USER_ROW_REFERENCES = frozenset({"organization", "site", "created_by", "modified_by", "age_days"})
+
+
+"""
+Seeds the leading rows of the fixture tables with one bulk insert per database.
+
+Purpose:
+    - Shares one seeding path between the DB-backed test classes; each takes the prefix of rows it needs.
+    - Resolves row references (organization, site, created_by, modified_by) once the referenced IDs exist.
+
+Returns:
+    tuple: (organizations, sites, users) lists in table order.
+"""
+
+def _seed_fixtures(organizations=len(_ORGANIZATION_ROWS), sites=len(_SITE_ROWS), users=len(_USER_ROWS)):
+
+    # One clock reading for every fixture row, so timestamps within a row never skew
+    current_time = now()
+
+    organization_objs = Organization.objects.using("organizations_db").bulk_create([
+        Organization(**row, date_created=current_time, last_modified=current_time)
+        for row in _ORGANIZATION_ROWS[:organizations]
+    ])
+
+    site_objs = Site.objects.using("sites_db").bulk_create([
+        Site(
+            **{field: value for field, value in row.items() if field != "organization"},
+            organization_id=organization_objs[row["organization"]].id,
+            date_created=current_time,
+            last_modified=current_time,
+        )
+        for row in _SITE_ROWS[:sites]
+    ])
+
+    user_rows = _USER_ROWS[:users]
+    user_objs = User.objects.using("users_db").bulk_create([
+        User(
+            **{field: value for field, value in row.items() if field not in _USER_ROW_REFERENCES},
+            password=_TEST_PASSWORD_HASH,
+            organization_id=None if row["organization"] is None else organization_objs[row["organization"]].id,
+            site_id=None if row["site"] is None else site_objs[row["site"]].id,
+            date_joined=current_time - timedelta(days=row["age_days"]),
+        )
+        for row in user_rows
+    ])
+
+    # Fill in the user-to-user references once their IDs exist
+    referencing_users = []
+    for user, row in zip(user_objs, user_rows):
+        if row["created_by"] is None and row["modified_by"] is None:
+            continue
+        user.created_by_id = None if row["created_by"] is None else user_objs[row["created_by"]].id
+        user.modified_by_id = None if row["modified_by"] is None else user_objs[row["modified_by"]].id
+        referencing_users.append(user)
+    if referencing_users:
+        User.objects.using("users_db").bulk_update(referencing_users, ["created_by_id", "modified_by_id"])
+
+    return organization_objs, site_objs, user_objs
+
+# Character classes for the password complexity checks
+_UPPER_SET = frozenset(string.ascii_uppercase)
+_LOWER_SET = frozenset(string.ascii_lowercase)
+_DIGIT_SET = frozenset(string.digits)
+_SPECIAL_SET = frozenset(UserManager.SPECIAL_CHARACTERS)
+
+# Pulls the generated password out of the credentials email body
+_TEMP_PW_RE = re.compile(r"^\s*Temporary Password:\s*(.*)$", re.MULTILINE)
+
+# All fixture users share one password, hashed once at import and reused by every fixture
+_TEST_PASSWORD_HASH = make_password("SecurePass123!")
+
+@contextmanager
+def swap_secrets_choice(replacement):
+    """
+    Temporarily replace `secrets.choice` on the stdlib `secrets` module that `users.managers` imports.
+    The swap is process-wide while the block runs, not limited to `users.managers`.
+    A plain attribute swap avoids building a MagicMock for tests that only need a fixed result or error.
+    """
+    original = managers.secrets.choice
+    managers.secrets.choice = replacement
+    try:
+        yield
+    finally:
+        managers.secrets.choice = original
+
+def _raise_empty_sequence(*args, **kwargs):
+    raise IndexError("Empty sequence")
+
+class UsersDatabaseMixin:
+    """
+    Shared setup for the test classes that seed fixtures with `_seed_fixtures()`.
+
+    - `databases` lists the three databases the fixtures span; see `UserModelTests` for why `default` is left out.
+    - `users_qs` is a base queryset bound to `users_db` once; every lookup clones it, so it is never evaluated itself.
+    - `user_manager` is the model's own manager pinned to `users_db`, so create_user() and update_user() run through the real `User.objects`.
+    - `setUpClass()` fails fast if any database in `databases` cannot run transactions, since `TestCase`
+        would otherwise lose its savepoint rollback on that database.
+    """
+
+    databases = {"users_db", "organizations_db", "sites_db"}
+    users_qs = User.objects.using("users_db")
+    user_manager = User.objects.db_manager("users_db")
+
+    @classmethod
+    def setUpClass(cls):
+        # Checked before super() opens the class-wide atomic blocks
+        for alias in cls.databases:
+            if not connections[alias].features.supports_transactions:
+                raise ImproperlyConfigured(f"Test database '{alias}' must support transactions for TestCase rollback.")
+        super().setUpClass()
+
+class UserModelTests(UsersDatabaseMixin, TestCase):
     """
     TransactionTestCase.databases explained:
         
@@ -43,11 +201,13 @@ class UserModelTests(TestCase):
     4. **Transaction Wrapping in `TestCase`**:
         - By default, only the **default database** is wrapped in a transaction during `TestCase` execution.
         - To enable transaction wrapping for **non-default databases**, explicitly declare them using `databases`.
+        - Every listed database must support transactions (SQLite, PostgreSQL); otherwise `TestCase`
+            falls back to flushing that database after each test instead of rolling back a savepoint.
+        - List only the databases the tests actually touch; these tests never use `default`, so it is left out
+            and none of its per-test savepoints are opened.
 
     Guarantees proper database isolation, optimizes test execution time, and ensures consistency when testing across multiple databases.
     """
-    
-    databases = {"default", "users_db", "organizations_db", "sites_db"}
 
     """
     Performs class-wide setup before any test in this class executes.
@@ -71,10 +231,13 @@ class UserModelTests(TestCase):
         super().setUpClass()
 
     """
-    Prepares test data before each test method runs to ensure consistency across multiple databases.
+    Prepares test data once for the whole class to ensure consistency across multiple databases.
 
     Purpose:
-        - Ensures each test starts with a fresh and structured dataset.
+        - Builds the dataset a single time per class; `TestCase` wraps each test in a
+            savepoint on every database in `databases`, so changes are rolled back between tests.
+        - Runs inside the class-level `atomic()` block that `TestCase` opens on each database,
+            so all fixture inserts commit as one transaction per database (no extra wrapping needed).
         - Establishes consistent relationships between organizations, sites, and users.
         - Provides diverse user attributes to thoroughly test query methods.
         - Simulates real-world scenarios, including active/inactive users, staff roles, and multi-database queries.
@@ -101,829 +264,311 @@ class UserModelTests(TestCase):
     Guarantees that all test cases begin with a structured and representative dataset for validation.
     """
 
-    def setUp(self):
-
-        # Iinitializes UserManager instance.
-        self.user_manager = UserManager()
-
-        # Use apps.get_model() to ensure cross-app consistency
-        Organization = apps.get_model("organizations", "Organization")
-        Site = apps.get_model("sites", "Site")
-        User = apps.get_model("users", "User")
-        
-        # Create test organizations
-        self.organization1 = Organization.objects.using("organizations_db").create(
-            #id = "1",
-            name="Test Organization 1",
-            type_id=1,
-            active=True,
-            contact_id=None,  # Ensuring this field is handled
-            login_options={},  # Matches model default
-            mfa_required=False,  # Matches model default
-            created_by_id=None,
-            date_created=now(),
-            last_modified=now(),
-            modified_by_id=None
-        )
-
-        self.organization2 = Organization.objects.using("organizations_db").create(
-            #id = "2",
-            name="Test Organization 2",
-            type_id=2,
-            active=True,
-            contact_id=None,  # Ensuring this field is handled
-            login_options={},  # Matches model default
-            mfa_required=False,  # Matches model default
-            created_by_id=None,
-            date_created=now(),
-            last_modified=now(),
-            modified_by_id=None
-        )
-
-        # Create test sites
-        self.site1 = Site.objects.using("sites_db").create(
-            #id = "1",
-            name="Test Site 1",
-            organization_id=self.organization1.id,
-            site_type="Office",
-            address="123 Test St",
-            active=True,
-            created_by_id=None,
-            date_created=now(),
-            last_modified=now(),
-            modified_by_id=None
-        )
-
-        self.site2 = Site.objects.using("sites_db").create(
-            #id = "2",
-            name="Test Site 2",
-            organization_id=self.organization2.id,
-            site_type="Warehouse",
-            address="456 Another St",
-            active=True,
-            created_by_id=None,
-            date_created=now(),
-            last_modified=now(),
-            modified_by_id=None
-        )
-
-        # Create multiple test users with different attributes
-        self.user1 = User.objects.using("users_db").create(
-            #id = "1",
-            email="user1@example.com",
-            username="userone",
-            first_name="Alice",
-            last_name="Smith",
-            organization_id=self.organization1.id,
-            site_id=self.site1.id,
-            badge_barcode="BARCODE12345",
-            badge_rfid="RFID98765",
-            is_active=True,
-            is_staff=False,
-            mfa_preference="none",
-            created_by_id=None,
-            modified_by_id=None,
-            date_joined=now() - timedelta(days=5)
-        )
-
-        self.user1.set_password("SecurePass123!")
-        self.user1.save(using="users_db")
-
-        self.user2 = User.objects.using("users_db").create(
-            #id = "2",
-            email="user2@example.com",
-            username="usertwo",
-            password="SecurePass123!",
-            first_name="Bob",
-            last_name="Johnson",
-            organization_id=self.organization1.id,
-            site_id=self.site1.id,
-            badge_barcode="BARCODE23456",
-            badge_rfid="RFID87654",
-            is_active=False,  # Inactive user
-            is_staff=False,
-            mfa_preference="google_authenticator",
-            created_by_id=None,
-            modified_by_id=self.user1.id,
-            date_joined=now() - timedelta(days=40)
-        )
-
-        self.user2.set_password("SecurePass123!")
-        self.user2.save(using="users_db")
-
-        self.user3 = User.objects.using("users_db").create(
-            #id = "3",
-            email="user3@example.com",
-            username="userthree",
-            password="SecurePass123!",
-            first_name="Charlie",
-            last_name="Brown",
-            organization_id= None,
-            site_id= None,
-            badge_barcode="BARCODE34567",
-            badge_rfid="RFID76543",
-            is_active=True,
-            is_staff=True,  # Staff user
-            mfa_preference="sms",
-            created_by_id=None,
-            modified_by_id=self.user1.id,
-            date_joined=now() - timedelta(days=15)
-        )
-
-        self.user3.set_password("SecurePass123!")
-        self.user3.save(using="users_db")
-
-        self.user4 = User.objects.using("users_db").create(
-            #id = "4",
-            email="user4@example.com",
-            username="userfour",
-            password="SecurePass123!",
-            first_name="Dana",
-            last_name="White",
-            organization_id=None,
-            site_id=None,
-            badge_barcode="BARCODE45678",
-            badge_rfid="RFID65432",
-            is_active=True,
-            is_staff=False,
-            mfa_preference="email",
-            created_by_id=self.user1.id,
-            modified_by_id=self.user2.id,
-            date_joined=now()
-        )
-
-        self.user4.set_password("SecurePass123!")
-        self.user4.save(using="users_db")
-
-    """
-    Verifies that the test organization exists after setup.
-
-    Purpose:
-        - Ensures that `setUp()` correctly creates and stores the organization in `organizations_db`.
-
-    Expected Behavior:
-        - Organization with `self.organization1.id` should be present in the test database.
-
-    Test Steps:
-        1. Retrieve `organization1` using `apps.get_model()` and `filter()`.
-        2. Assert that the retrieved organization is **not None**.
-
-    Guarantees that the test database correctly initializes the organization data before running tests.
-    """
-
-    # Test 1a: Ensure test organization 1 exists
-    def test_users_test_managers_UserModelTests_setUp_OrganizationExists_org2(self):
-        Organization = apps.get_model("organizations", "Organization")
-        organization = Organization.objects.using("organizations_db").filter(id=self.organization1.id).first()
-        self.assertIsNotNone(organization, "Organization1 should exist in the test database.")
-
-    # Test 1b: Ensure test organization 2 exists
-    def test_users_test_managers_UserModelTests_setUp_OrganizationExists_org2(self):
-        Organization = apps.get_model("organizations", "Organization")
-        organization = Organization.objects.using("organizations_db").filter(id=self.organization2.id).first()
-        self.assertIsNotNone(organization, "Organization2 should exist in the test database.")
-
-    """
-    Verifies that the test site exists after setup.
-
-    Purpose:
-        - Ensures that `setUp()` correctly creates and stores the site in `sites_db`.
-
-    Expected Behavior:
-        - Site with `self.site1.id` should be present in the test database.
-
-    Test Steps:
-        1. Retrieve `site1` using `apps.get_model()` and `filter()`.
-        2. Assert that the retrieved site is **not None**.
-
-    Guarantees that the test database correctly initializes the site data before running tests.
-    """
-
-    # Test 2a: Ensure test site exists
-    def test_users_test_managers_UserModelTests_setUp_SiteExists_site1(self):
-        Site = apps.get_model("sites", "Site")
-        site = Site.objects.using("sites_db").filter(id=self.site1.id).first()
-        self.assertIsNotNone(site, "Site1 should exist in the test database.")
-
-    # Test 2b: Ensure test site exists
-    def test_users_test_managers_UserModelTests_setUp_SiteExists_site2(self):
-        Site = apps.get_model("sites", "Site")
-        site = Site.objects.using("sites_db").filter(id=self.site2.id).first()
-        self.assertIsNotNone(site, "Site2 should exist in the test database.")
-
-    """
-    Verifies that the test user exists after setup.
-
-    Purpose:
-        - Ensures that `setUp()` correctly creates and stores the user in `users_db`.
-
-    Expected Behavior:
-        - User with `self.user1.id` should be present in the test database.
-
-    Test Steps:
-        1. Retrieve `user1` using `apps.get_model()` and `filter()`.
-        2. Assert that the retrieved user is **not None**.
-
-    Guarantees that the test database correctly initializes user data before running tests.
-    """
-    
-    # Test 3a: Ensure test user 1 exists
-    def test_users_test_managers_UserModelTests_setUp_UserExists_user1(self):
-        User = apps.get_model("users", "User")
-        user = User.objects.using("users_db").filter(id=self.user1.id).first()
-        self.assertIsNotNone(user, "User1 should exist in the test database.")
-
-    # Test 3b: Ensure test user 2 exists
-    def test_users_test_managers_UserModelTests_setUp_UserExists_user2(self):
-        User = apps.get_model("users", "User")
-        user = User.objects.using("users_db").filter(id=self.user2.id).first()
-        self.assertIsNotNone(user, "User2 should exist in the test database.")
-
-    # Test 3c: Ensure test user 3 exists
-    def test_users_test_managers_UserModelTests_setUp_UserExists_user3(self):
-        User = apps.get_model("users", "User")
-        user = User.objects.using("users_db").filter(id=self.user3.id).first()
-        self.assertIsNotNone(user, "User3 should exist in the test database.")
-
-    # Test 3d: Ensure test user 4 exists
-    def test_users_test_managers_UserModelTests_setUp_UserExists_user4(self):
-        User = apps.get_model("users", "User")
-        user = User.objects.using("users_db").filter(id=self.user4.id).first()
-        self.assertIsNotNone(user, "User4 should exist in the test database.")        
-    
-    """
-    Verifies that the test user's email is correctly set.
-
-    Purpose:
-        - Ensures that `setUp()` assigns the correct email to `user1`.
-
-    Expected Behavior:
-        - `self.user1.email` should match the expected value `"user1@example.com"`.
-
-    Test Steps:
-        1. Retrieve `self.user1.email`.
-        2. Assert that it matches the expected value.
-
-    Guarantees that user email is properly assigned during setup.
-    """
-   
-    # Test 4a: Ensure test user 1 email is correctly set
-    def test_users_test_managers_UserModelTests_setUp_UserEmailCorrect_user1(self):
-        self.assertEqual(self.user1.email, "user1@example.com", "User email does not match expected value.")
-
-    # Test 4b: Ensure test user 2 email is correctly set
-    def test_users_test_managers_UserModelTests_setUp_UserEmailCorrect_user2(self):
-        self.assertEqual(self.user2.email, "user2@example.com", "User email does not match expected value.")
-    
-    # Test 4c: Ensure test user 3 email is correctly set
-    def test_users_test_managers_UserModelTests_setUp_UserEmailCorrect_user3(self):
-        self.assertEqual(self.user3.email, "user3@example.com", "User email does not match expected value.")
-
-    # Test 4d: Ensure test user 4 email is correctly set
-    def test_users_test_managers_UserModelTests_setUp_UserEmailCorrect_user4(self):
-        self.assertEqual(self.user4.email, "user4@example.com", "User email does not match expected value.")
-    
-    """
-    Verifies that the test user's username is correctly set.
-
-    Purpose:
-        - Ensures that `setUp()` assigns the correct username to `user1`.
-
-    Expected Behavior:
-        - `self.user1.username` should match the expected value `"userone"`.
-
-    Test Steps:
-        1. Retrieve `self.user1.username`.
-        2. Assert that it matches the expected value.
-
-    Guarantees that user username is properly assigned during setup.
-    """
-
-    # Test 5a: Ensure test user 1 username is correctly set
-    def test_users_test_managers_UserModelTests_setUp_UserUsernameCorrect_user1(self):
-        self.assertEqual(self.user1.username, "userone", "User username does not match expected value.")
-
-    # Test 5b: Ensure test user 2 username is correctly set
-    def test_users_test_managers_UserModelTests_setUp_UserUsernameCorrect_user2(self):
-        self.assertEqual(self.user2.username, "usertwo", "User username does not match expected value.")
+    @classmethod
+    def setUpTestData(cls):
 
-    # Test 5c: Ensure test user 3 username is correctly set
-    def test_users_test_managers_UserModelTests_setUp_UserUsernameCorrect_user3(self):
-        self.assertEqual(self.user3.username, "userthree", "User username does not match expected value.")
+        organizations, sites, users = _seed_fixtures()
+        cls.organization1, cls.organization2 = organizations
+        cls.site1, cls.site2 = sites
+        cls.user1, cls.user2, cls.user3, cls.user4 = users
 
-    # Test 5d: Ensure test user 4 username is correctly set
-    def test_users_test_managers_UserModelTests_setUp_UserUsernameCorrect_user4(self):
-        self.assertEqual(self.user4.username, "userfour", "User username does not match expected value.")
-    
     """
-    Verifies that the test user's `organization_id` is correctly set.
+    Verifies that every fixture row was persisted by `setUpTestData()`.
 
     Purpose:
-        - Ensures that `setUp()` assigns the correct organization ID to `user1`.
+        - Ensures the bulk inserts into `organizations_db`, `sites_db`, and `users_db` all succeeded.
 
     Expected Behavior:
-        - `self.user1.organization_id` should match `self.organization1.id`.
+        - Both organizations, both sites, and all four users carry a primary key returned by `bulk_create()`.
 
     Test Steps:
-        1. Retrieve `self.user1.organization_id`.
-        2. Assert that it matches the expected value.
-
-    Guarantees that the user is associated with the correct organization.
-    """
-
-    # Test 6a: Ensure test user 1 organization_id is correctly set
-    def test_users_test_managers_UserModelTests_setUp_UserOrganizationCorrect_user1(self):
-        self.assertEqual(self.user1.organization_id, self.organization1.id, "User 1 organization_id does not match expected value.")
-
-    # Test 6b: Ensure test user 2 organization_id is correctly set
-    def test_users_test_managers_UserModelTests_setUp_UserOrganizationCorrect_user2(self):
-        self.assertEqual(self.user2.organization_id, self.organization1.id, "User 2 organization_id does not match expected value.")
-
-    # Test 6c: Ensure test user 3 organization_id is correctly set (None)
-    def test_users_test_managers_UserModelTests_setUp_UserOrganizationCorrect_user3(self):
-        self.assertIsNone(self.user3.organization_id, "User 3 organization_id should be None.")
-
-    # Test 6d: Ensure test user 4 organization_id is correctly set (None)
-    def test_users_test_managers_UserModelTests_setUp_UserOrganizationCorrect_user4(self):
-        self.assertIsNone(self.user4.organization_id, "User 4 organization_id should be None.")
-    
-    """
-    Verifies that the test user's `site_id` is correctly set.
+        1. Check the primary key of each fixture object (one subTest per object).
+        2. Run a single `exists()` query per database to confirm the rows can be read back.
+
+    Guarantees that the test databases are seeded before any other test relies on them, without re-reading each row.
+    """
+
+    # Test 1-3: Ensure test organizations, sites, and users were persisted
+    def test_users_test_managers_UserModelTests_setUpTestData_FixturesPersisted(self):
+        for label, obj in [
+            ("org1", self.organization1),
+            ("org2", self.organization2),
+            ("site1", self.site1),
+            ("site2", self.site2),
+            ("user1", self.user1),
+            ("user2", self.user2),
+            ("user3", self.user3),
+            ("user4", self.user4),
+        ]:
+            with self.subTest(fixture=label):
+                self.assertIsNotNone(obj.pk, f"{label} should have been saved to the test database.")
+
+        # One EXISTS round-trip per database confirms the rows are readable back
+        for alias, queryset in [
+            ("organizations_db", Organization.objects.using("organizations_db").filter(id=self.organization1.id)),
+            ("sites_db", Site.objects.using("sites_db").filter(id=self.site1.id)),
+            ("users_db", self.users_qs.filter(id=self.user1.id)),
+        ]:
+            with self.subTest(database=alias):
+                self.assertTrue(queryset.exists(), f"Fixture row missing from {alias}.")
+
+    """
+    Verifies that each test user's identifying fields are correctly set.
 
     Purpose:
-        - Ensures that `setUp()` assigns the correct site ID to `user1`.
+        - Ensures that `setUpTestData()` assigns the correct email, username, organization ID,
+            and site ID to every fixture user.
 
     Expected Behavior:
-        - `self.user1.site_id` should match `self.site1.id`.
+        - `self.userN.email` matches `"userN@example.com"`; usernames are `"userone"` through `"userfour"`.
+        - `user1` and `user2` belong to `self.organization1` and `self.site1`.
+        - `user3` and `user4` have no organization or site (`None`).
 
     Test Steps:
-        1. Retrieve `self.user1.site_id`.
-        2. Assert that it matches the expected value.
-
-    Guarantees that the user is associated with the correct site.
-    """
-
-    # Test 7a: Ensure test user 1 site_id is correctly set
-    def test_users_test_managers_UserModelTests_setUp_UserSiteCorrect_user1(self):
-        self.assertEqual(self.user1.site_id, self.site1.id, "User 1 site_id does not match expected value.")
-
-    # Test 7b: Ensure test user 2 site_id is correctly set
-    def test_users_test_managers_UserModelTests_setUp_UserSiteCorrect_user2(self):
-        self.assertEqual(self.user2.site_id, self.site1.id, "User 2 site_id does not match expected value.")
-
-    # Test 7c: Ensure test user 3 site_id is correctly set (None)
-    def test_users_test_managers_UserModelTests_setUp_UserSiteCorrect_user3(self):
-        self.assertIsNone(self.user3.site_id, "User 3 site_id should be None.")
-
-    # Test 7d: Ensure test user 4 site_id is correctly set ("")
-    def test_users_test_managers_UserModelTests_setUp_UserSiteCorrect_user4(self):
-        self.assertIsNone(self.user4.site_id, "User 4 site_id should be None.")
+        1. Walk a table of `(user, email, username, organization_id, site_id)` rows.
+        2. Assert each field matches (one subTest per user and field).
 
+    Guarantees that fixture users carry the identifiers and associations the other tests rely on.
     """
-    Tests normalize_email() in UserManager to ensure proper email formatting and error handling.
-
-    Purpose:
-        - Ensures email addresses are correctly formatted before being saved.
-        - Confirms normalization handles case sensitivity and whitespace.
-        - Validates that invalid email formats raise a `ValueError`.
-
-    Expected Behavior:
-        - Converts uppercase letters to lowercase.
-        - Strips leading and trailing whitespace.
-        - Returns `None` when given `None` as input.
-        - Raises a `ValueError` when given an invalid email format.
-
-    Test Cases (Grouped under Test 8):
-        8a. **Uppercase Letters** → Converts "USER@Example.COM" to "user@example.com".
-        8b. **Leading & Trailing Spaces** → Strips spaces from "  user@example.com  ".
-        8c. **Mixed-Case Email** → Normalizes "MiXEDcAsE@DOMAIN.CoM" to "mixedcase@domain.com".
-        8d. **None Input** → Returns `None` without raising an error.
-        8e. **Invalid Email Format** → Raises `ValueError` for malformed emails (e.g., "INVALID EMAIL@EXAMPLE.COM").
 
-    Guarantees that email normalization works correctly before storing user data.
-    """
-
-    #Test 8a: Ensure uppercase emails are converted to lowercase.
-    def test_users_test_managers_UserManager_normalize_email_uppercase(self):
-        raw_email = "  USER@Example.COM  "
-        expected_email = "user@example.com"
-        normalized_email = self.user_manager.normalize_email(raw_email)
-        self.assertEqual(normalized_email, expected_email, "Uppercase email normalization failed.")
-
-    # Test 8b:Ensure leading and trailing spaces are removed.
-    def test_users_test_managers_UserManager_normalize_email_leading_trailing_spaces(self):
-        raw_email = "  user@example.com  "
-        expected_email = "user@example.com"
-        normalized_email = self.user_manager.normalize_email(raw_email)
-        self.assertEqual(normalized_email, expected_email, "Email normalization failed to strip spaces.")
-    
-    # Test 8c:Ensure mixed-case emails normalize correctly.
-    def test_users_test_managers_UserManager_normalize_email_mixed_case(self):
-        raw_email = "MiXEDcAsE@DOMAIN.CoM"
-        expected_email = "mixedcase@domain.com"
-        normalized_email = self.user_manager.normalize_email(raw_email)
-        self.assertEqual(normalized_email, expected_email, "Mixed-case email normalization failed.")
-
-    # Test 8d:Ensure None input returns None.
-    def test_users_test_managers_UserManager_normalize_email_none_input(self):
-        raw_email = None
-        normalized_email = self.user_manager.normalize_email(raw_email)
-        self.assertIsNone(normalized_email, "None email input should return None.")
-
-    # Test 8e:Ensure invalid email formats raise a ValueError.
-    def test_users_test_managers_UserManager_normalize_email_invalid_format(self):
-        raw_email = "INVALID EMAIL@EXAMPLE.COM"
-        with self.assertRaises(ValueError, msg="normalize_email() should raise ValueError for an invalid email format."):
-            self.user_manager.normalize_email(raw_email)
+    # Test 4-7: Ensure test user emails, usernames, organization_ids and site_ids are correctly set
+    def test_users_test_managers_UserModelTests_setUpTestData_UserFieldsCorrect(self):
+        for label, user, expected in [
+            ("user1", self.user1, ("user1@example.com", "userone", self.organization1.id, self.site1.id)),
+            ("user2", self.user2, ("user2@example.com", "usertwo", self.organization1.id, self.site1.id)),
+            ("user3", self.user3, ("user3@example.com", "userthree", None, None)),
+            ("user4", self.user4, ("user4@example.com", "userfour", None, None)),
+        ]:
+            for field, expected_value in zip(("email", "username", "organization_id", "site_id"), expected):
+                with self.subTest(user=label, field=field):
+                    self.assertEqual(getattr(user, field), expected_value, f"{label} {field} does not match expected value.")
 
+# Pin the fast hasher even when the suite is launched without `manage.py test` (TESTING unset)
+@override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"])
+class UserManagerCreateUserTests(UsersDatabaseMixin, TestCase):
     """
-    Tests generate_secure_password() to ensure strong password generation.
+    Database-backed test coverage for the UserManager create_user() method and its duplicate checks.
 
     Purpose:
-        - Confirms that generated passwords meet security and complexity requirements.
-        - Ensures that passwords contain all required character types.
-        - Validates that passwords are unique across multiple generations.
-        - Ensures the function raises an error when attempting to generate a password below the minimum length.
-
-    Expected Behavior:
-        - Generates passwords with a minimum length of 16 characters.
-        - Each password contains at least one uppercase letter, one lowercase letter, one digit, and one special character.
-        - Passwords are randomly generated and unique.
-        - Raises a `ValueError` if a password shorter than 16 characters is requested.
-
-    Test Cases:
-        9a. **Default Password Length (16)** → Confirms generated password meets minimum length.
-        9b. **Custom Password Length (20)** → Ensures requested length is respected.
-        9c. **Password Character Validation**:
-            1. Must contain at least one uppercase letter.
-            2. Must contain at least one lowercase letter.
-            3. Must contain at least one digit.
-            4. Must contain at least one special character.
-        9d. **Password Uniqueness** → Multiple generated passwords should not be identical.
-        9e. **Password Below Minimum Length** → Attempting to generate a password <16 should raise a `ValueError`.
-
-    Guarantees that password generation adheres to security best practices and prevents weak or predictable passwords.
-    """
-
-    
-    # Test 9a: Ensure default password length is 16 characters
-    def test_users_test_managers_UserManager_generate_secure_password_default_length(self):
-        password = self.user_manager.generate_secure_password()
-        self.assertEqual(len(password), 16, "Default password length should be 16.")
-
-    # Test 9b: Ensure custom password length works (20 characters)
-    def test_users_test_managers_UserManager_generate_secure_password_custom_length(self):
-        password = self.user_manager.generate_secure_password(length=20)
-        self.assertEqual(len(password), 20, "Custom password length should be 20.")
-
-    # Test 9c-1: Ensure password contains at least one uppercase letter
-    def test_users_test_managers_UserManager_generate_secure_password_contains_uppercase(self):
-        password = self.user_manager.generate_secure_password()
-        has_upper = any(c.isupper() for c in password)
-        self.assertTrue(has_upper, "Password missing an uppercase letter.")
-
-    # Test 9c-2: Ensure password contains at least one lowercase letter
-    def test_users_test_managers_UserManager_generate_secure_password_contains_lowercase(self):
-        password = self.user_manager.generate_secure_password()
-        has_lower = any(c.islower() for c in password)
-        self.assertTrue(has_lower, "Password missing a lowercase letter.")
-
-    # Test 9c-3: Ensure password contains at least one digit
-    def test_users_test_managers_UserManager_generate_secure_password_contains_digit(self):
-        password = self.user_manager.generate_secure_password()
-        has_digit = any(c.isdigit() for c in password)
-        self.assertTrue(has_digit, "Password missing a digit.")
-
-    # Test 9c-4: Ensure password contains at least one special character
-    def test_users_test_managers_UserManager_generate_secure_password_contains_special_character(self):
-        password = self.user_manager.generate_secure_password()
-        has_special = any(c in self.user_manager.SPECIAL_CHARACTERS for c in password)
-        self.assertTrue(has_special, "Password missing a special character from the approved set.")
-
-    # Test 9d: Ensure generated passwords are unique
-    def test_users_test_managers_UserManager_generate_secure_password_uniqueness(self):
-        password_set = {self.user_manager.generate_secure_password() for _ in range(10)}
-        self.assertGreater(len(password_set), 1, "Generated passwords should not be identical.")
-
-    # Test 9e: Ensure attempting to generate a password below 16 characters raises ValueError
-    def test_users_test_managers_UserManager_generate_secure_password_min_length_violation(self):
-
-        with self.assertRaises(ValueError, msg="Password length below 16 should raise a ValueError."):
-            self.user_manager.generate_secure_password(length=12)
-
-    # Test 9f: Raises ValueError if required character sets are empty
-    def test_users_test_managers_UserManager_generate_secure_password_raises_if_charset_missing(self):
-        manager = self.user_manager
-
-        # Patch 'SPECIAL_CHARACTERS' to an empty list to force IndexError
-        with patch("users.managers.secrets.choice", side_effect=IndexError("Empty sequence")):
-            with self.assertRaises(ValueError) as context:
-                manager.generate_secure_password()
-            self.assertIn("Character set missing required characters", str(context.exception))
-    
-    # Test 9g: Raises ValueError if final password fails complexity check
-    def test_users_test_managers_UserManager_generate_secure_password_complexity_check_fails(self):
-        manager = self.user_manager
-
-        # Patch secrets.choice and random_chars to force bad password output
-        with patch("users.managers.secrets.choice", return_value="a"):  # Force lowercase
-            with self.assertRaises(ValueError) as context:
-                manager.generate_secure_password()
-            self.assertIn("Generated password does not meet complexity requirements", str(context.exception))
-
-    """
-    Comprehensive test coverage for the UserManager create_user() method and its supporting logic.
-
-    Purpose:
-        - Validate correct user creation and error handling under various conditions.
-        - Ensure password generation, normalization, validation, and secure storage function as expected.
+        - Validate correct user creation and the errors raised once a query is involved.
+        - Ensure normalization and secure password storage on saved users.
         - Verify duplicate protection, email delivery, and failure handling.
 
     Test Coverage Includes:
 
     Standalone Tests (Direct create_user Behavior & Constraints)
-        - Successful user creation with all required fields populated.
+        - Successful user creation with all required fields populated, within a fixed query budget.
         - Automatic email normalization (trimming whitespace and lowercasing).
         - Ensuring password is properly hashed and secure.
         - Validation that users are active by default unless explicitly set inactive.
         - Proper handling of is_active=False when provided.
-        - Raises ValueError if email is missing or blank.
-        - Raises ValueError if login identifiers (username, badge_barcode, badge_rfid) are missing.
         - Prevents active duplicate creation of:
             - Email
             - Username
             - Badge Barcode
             - Badge RFID
+        - Duplicates passed with a different Python type still raise; unset identifiers never count as duplicates.
         - Validates support for creating users with **all unique identifiers** present.
-        - Raises ValueError when a blank password is passed (security enforcement).
+        - Raises ValueError when a blank password is passed, before any query runs.
 
     Grouped Functional Test Blocks
-        1. Password Complexity & Generation Tests
-            - Validates all complexity requirements (uppercase, lowercase, digits, special characters).
-            - Ensures minimum length.
-    
-        2. Inactive User Duplicate Handling
+        1. Inactive User Duplicate Handling
             - Confirms inactive users can reuse unique identifiers of other inactive users without conflict.
 
-        3. Email Delivery Tests
+        2. Email Delivery Tests
             - Verifies email is sent correctly, with the correct recipient, subject, and content (login credentials).
 
-        4. Email Failure Handling Tests
+        3. Email Failure Handling Tests
             - Ensures that email delivery failures do not break user creation.
             - Confirms email failure properly sets `email_sent = False`.
 
+    The missing-email, missing-identifier and password generation tests need no database
+        and live in `UserManagerPureTests`.
+
     Expectations:
-        - The create_user() method strictly enforces all required fields, uniqueness, and password security.
+        - The create_user() method strictly enforces uniqueness among active users and password security.
         - The system allows duplicate inactive records where expected but blocks duplicates on active users.
         - Emails are reliably sent upon success and safely handled when failures occur.
-        - Passwords are securely generated, validated, and hashed before storage.
     """
 
-    # Test 10a: Ensure a user can be created successfully
-    def test_users_test_managers_UserManager_create_user_success(self):
-        user, _ = self.user_manager.create_user(
-            email="user5@example.com",
-            username="userfive",
-            password=None,  # Auto-generated
-            first_name="Jane",
-            last_name="Doe",
-            organization_id=self.organization1.id,
-            site_id=self.site1.id,
-            created_by_id=None,
-        )
+    # Builds create_user() kwargs: the shared defaults, the fixture organization/site, then the test's own fields
+    @classmethod
+    def _user_kwargs(cls, **fields):
+        return {
+            **DEFAULT_USER_KWARGS,
+            "organization_id": cls.organization1.id,
+            "site_id": cls.site1.id,
+            **fields,
+        }
 
-        self.assertIsInstance(user, User, "User creation failed, did not return a User instance.")
+    """
+    Creates only the rows the create_user() tests rely on.
 
-    # Test 10b: Ensure the email is normalized correctly
-    def test_users_test_managers_UserManager_create_user_email_normalization(self):
-        unique_timestamp = int(time.time())
-        raw_email = f"  NEWUSER_{unique_timestamp}@EXAMPLE.COM  "
-        expected_email = raw_email.strip().lower()
-
-        user, _ = self.user_manager.create_user(
-            email=raw_email,
-            username=f"testuser_{unique_timestamp}",
-            password=None,
-            first_name="Jane",
-            last_name="Doe",
-            organization_id=self.organization1.id,
-            site_id=self.site1.id,
-            created_by_id=None,
-        )
+    Purpose:
+        - `organization1` and `site1` supply valid foreign-key IDs for new users.
+        - `user1` (active) and `user2` (inactive) supply identifiers for the duplicate-handling tests.
+        - `email_user` and `sent_email` capture one create_user() call for the email content tests.
+        - `seed_user` is created once from a padded email under PBKDF2 for the read-only create_user() checks.
+    """
 
-        self.assertEqual(user.email, expected_email, "Email was not normalized before saving.")
-    
-    # Test 10c: Ensure the password is set and hashed correctly
-    def test_users_test_managers_UserManager_create_user_password_is_hashed(self):
-        unique_timestamp = int(time.time())
-        raw_email = f"  NEWUSER_{unique_timestamp}@EXAMPLE.COM  "
-
-        user, _ = self.user_manager.create_user(
-            email=raw_email,
-            username=f"testuser_{unique_timestamp}",
-            password=None,
-            first_name="Jane",
-            last_name="Doe",
-            organization_id=self.organization1.id,
-            site_id=self.site1.id,
-            created_by_id=None,
-        )
+    @classmethod
+    def setUpTestData(cls):
 
-        self.assertTrue(user.password.startswith("pbkdf2_"), "Password should be hashed.")
-    
-    """
-    Tests the password complexity requirements enforced during create_user() 
-        by validating the behavior of the generate_secure_password() method.
+        # The first organization, site and two users from the shared row tables
+        organizations, sites, users = _seed_fixtures(organizations=1, sites=1, users=2)
+        (cls.organization1,), (cls.site1,) = organizations, sites
+        cls.user1, cls.user2 = users
 
-    Purpose:
-        - Ensures generated passwords meet all defined security complexity standards.
-        - Verifies inclusion of all required character types.
-        - Confirms the password length complies with the minimum requirement.
+        # One user and its credentials email, shared by the read-only email tests (10o).
+        # Start from an empty outbox: the per-test reset in TestCase has not run yet at this point.
+        mail.outbox = []
+        cls.email_user, cls.email_sent = cls.user_manager.create_user(**cls._user_kwargs(
+            email="emailtest@example.com",
+            username="emailtestuser",
+            badge_barcode="BARCODEEMAILTEST",
+            badge_rfid="RFIDEMAILTEST",
+        ))
+        cls.email_count = len(mail.outbox)
+        cls.sent_email = mail.outbox[0]
 
-    Expected Behavior:
-        - Each generated password contains at least one uppercase letter (A-Z).
-        - Each generated password contains at least one lowercase letter (a-z).
-        - Each generated password contains at least one numeric digit (0-9).
-        - Each generated password includes at least one special character from the allowed set.
-        - Generated passwords are a minimum of 16 characters in length.
+        # One user created from a padded, upper-cased email under the production hasher,
+        # shared by the normalization, hashing and active-default tests (10b/10c/10e) and the duplicate-email test (10l)
+        cls.seed_raw_email, cls.seed_expected_email = "  NEWUSER@EXAMPLE.COM  ", "newuser@example.com"
+        with override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.PBKDF2PasswordHasher"]):
+            cls.seed_user, _ = cls.user_manager.create_user(**cls._user_kwargs(
+                email=cls.seed_raw_email,
+                username="seeduser",
+            ))
 
-    Test Cases:
-        1. **Uppercase Requirement**  
-            - Validates that the password includes at least one uppercase letter.
-        2. **Lowercase Requirement**  
-            - Validates that the password includes at least one lowercase letter.
-        3. **Digit Requirement**  
-            - Validates that the password includes at least one numeric digit.
-        4. **Special Character Requirement**  
-            - Validates that the password includes at least one special character from the approved list.
-        5. **Minimum Length Requirement**  
-            - Validates that the password is at least 16 characters long.
-
-    Guarantees that passwords generated for user accounts meet all complexity
-        requirements, supporting system security and compliance.
     """
-    
-    # Test 10d_1: Ensure generated password contains at least one uppercase letter
-    def test_UserManager_generate_secure_password_contains_uppercase(self):
-        password = self.user_manager.generate_secure_password()
-        self.assertTrue(any(c.isupper() for c in password), "Password must contain at least one uppercase letter.")
+    Mutes the credentials email for every test in this class.
 
-    # Test 10d_2: Ensure generated password contains at least one lowercase letter
-    def test_UserManager_generate_secure_password_contains_lowercase(self):
-        password = self.user_manager.generate_secure_password()
-        self.assertTrue(any(c.islower() for c in password), "Password must contain at least one lowercase letter.")
+    Purpose:
+        - create_user() always calls `send_mail`, but only the 10o tests inspect the message,
+            and they read the copy captured in `setUpTestData()`.
+        - The 10p tests patch `send_mail` again to simulate failures, which takes precedence inside the test.
+    """
 
-    # Test 10d_3: Ensure generated password contains at least one digit
-    def test_UserManager_generate_secure_password_contains_digit(self):
-        password = self.user_manager.generate_secure_password()
-        self.assertTrue(any(c.isdigit() for c in password), "Password must contain at least one digit.")
+    def setUp(self):
+        patcher = patch("users.managers.send_mail", return_value=1)
+        patcher.start()
+        self.addCleanup(patcher.stop)
 
-    # Test 10d_4: Ensure generated password contains at least one special character
-    def test_UserManager_generate_secure_password_contains_special_character(self):
-        special_characters = self.user_manager.SPECIAL_CHARACTERS
-        password = self.user_manager.generate_secure_password()
-        self.assertTrue(any(c in special_characters for c in password), "Password must contain at least one special character.")
+    # Test 10a: Ensure a user can be created successfully
+    def test_users_test_managers_UserManager_create_user_success(self):
+        # Duplicate check, INSERT and refresh on users_db; nothing may touch the organization or site databases
+        with self.assertNumQueries(3, using="users_db"), \
+                self.assertNumQueries(0, using="organizations_db"), \
+                self.assertNumQueries(0, using="sites_db"):
+            user, _ = self.user_manager.create_user(**self._user_kwargs(
+                email="user5@example.com",
+                username="userfive",
+            ))
 
-    # Test 10d_5: Ensure generated password meets minimum length requirement
-    def test_UserManager_generate_secure_password_meets_length_requirement(self):
-        password = self.user_manager.generate_secure_password()
-        self.assertGreaterEqual(len(password), 16, "Password must be at least 16 characters long.")
+        self.assertIsInstance(user, User, "User creation failed, did not return a User instance.")
+
+    # Test 10b: Ensure the email is normalized correctly
+    def test_users_test_managers_UserManager_create_user_email_normalization(self):
+        self.assertEqual(self.seed_user.email, self.seed_expected_email, "Email was not normalized before saving.")
+
+    # Test 10c: Ensure the password is set and hashed correctly
+    # seed_user was created under the production hasher, since test settings swap in MD5 for speed.
+    def test_users_test_managers_UserManager_create_user_password_is_hashed(self):
+        self.assertTrue(self.seed_user.password.startswith("pbkdf2_"), "Password should be hashed.")
 
     # Test 10e: Ensure newly created users are active by default
     def test_UserManager_create_user_defaults_is_active_to_true(self):
-        user, _  = self.user_manager.create_user(
-            email="defaultactive@example.com",
-            username="defaultactiveuser",
-            password=None,
-            first_name="Jane",
-            last_name="Doe",
-            organization_id=self.organization1.id,
-            site_id=self.site1.id,
-            created_by_id=None,
-        )
-
-        self.assertTrue(user.is_active, "New users should be active by default.")
+        self.assertTrue(self.seed_user.is_active, "New users should be active by default.")
 
     # Test 10f: Ensure is_active=False when explicitly set
     def test_UserManager_create_user_explicitly_sets_is_active_false(self):
-        user, _  = self.user_manager.create_user(
+        user, _  = self.user_manager.create_user(**self._user_kwargs(
             email="inactiveuser@example.com",
             username="inactiveuser",
-            password=None,
-            first_name="John",
-            last_name="Doe",
-            organization_id=self.organization1.id,
-            site_id=self.site1.id,
-            created_by_id=None,
             is_active=False,  # Explicitly setting is_active=False
-        )
+        ))
 
         self.assertFalse(user.is_active, "User should remain inactive when explicitly set to False.")
     
-    # Test 10g: Ensure missing email raises ValueError
-    def test_users_test_managers_UserManager_create_user_missing_email_fails(self):
-        with self.assertRaises(ValueError, msg="Expected ValueError when creating a user without an email."):
-            self.user_manager.create_user(
-                email=None,
-                username="testuser_no_email",
-                password=None,
-                first_name="John",
-                last_name="Doe",
-                organization_id=self.organization1.id,
-                site_id=self.site1.id,
-            )
-    
-    # Test 10h: Ensure missing login identifier raises ValueError
-    def test_users_test_managers_UserManager_create_user_missing_login_identifier_fails(self):
-        with self.assertRaises(ValueError, msg="Expected ValueError when creating a user without a login identifier."):
-            self.user_manager.create_user(
-                email="identifier_missing@example.com",
-                username=None,
-                badge_barcode=None,
-                badge_rfid=None,
-                password=None,
-                first_name="John",
-                last_name="Doe",
-                organization_id=self.organization1.id,
-                site_id=self.site1.id,
-            )
-            
     # Test 10i: Ensure duplicate username raises ValueError
-    def test_users_test_managers_UserManager_create_user_duplicate_username_fails(self):
-        with self.assertRaises(ValueError, msg="Expected ValueError when creating a user with a duplicate username."):
-            self.user_manager.create_user(
+    def test_users_test_managers_UserManager_validate_unique_identifiers_duplicate_username_fails(self):
+        with self.assertRaisesMessage(ValueError, "An active user with this username already exists."):
+            self.user_manager._validate_unique_identifiers(
                 email="uniqueuser@example.com",
-                username=self.user1.username,  # Duplicate username from setUp()
-                password=None,
-                first_name="John",
-                last_name="Doe",
-                organization_id=self.organization1.id,
-                site_id=self.site1.id,
+                username=self.user1.username,  # Duplicate username from setUpTestData()
             )
 
     # Test 10j: Ensure duplicate badge_barcode raises ValueError
-    def test_users_test_managers_UserManager_create_user_duplicate_badge_barcode_fails(self):
-        with self.assertRaises(ValueError, msg="Expected ValueError when creating a user with a duplicate badge barcode."):
-            self.user_manager.create_user(
+    def test_users_test_managers_UserManager_validate_unique_identifiers_duplicate_badge_barcode_fails(self):
+        with self.assertRaisesMessage(ValueError, "An active user with this badge barcode already exists."):
+            self.user_manager._validate_unique_identifiers(
                 email="barcodeuser@example.com",
                 username="barcodeuser",
-                badge_barcode=self.user1.badge_barcode,  # Duplicate barcode from setUp()
-                password=None,
-                first_name="John",
-                last_name="Doe",
-                organization_id=self.organization1.id,
-                site_id=self.site1.id,
+                badge_barcode=self.user1.badge_barcode,  # Duplicate barcode from setUpTestData()
             )
 
     # Test 10k: Ensure duplicate badge_rfid raises ValueError
-    def test_users_test_managers_UserManager_create_user_duplicate_badge_rfid_fails(self):
-        with self.assertRaises(ValueError, msg="Expected ValueError when creating a user with a duplicate badge RFID."):
-            self.user_manager.create_user(
+    def test_users_test_managers_UserManager_validate_unique_identifiers_duplicate_badge_rfid_fails(self):
+        with self.assertRaisesMessage(ValueError, "An active user with this badge RFID already exists."):
+            self.user_manager._validate_unique_identifiers(
                 email="rfiduser@example.com",
                 username="rfiduser",
-                badge_rfid=self.user1.badge_rfid,  # Duplicate RFID from setUp()
-                password=None,
-                first_name="John",
-                last_name="Doe",
-                organization_id=self.organization1.id,
-                site_id=self.site1.id,
+                badge_rfid=self.user1.badge_rfid,  # Duplicate RFID from setUpTestData()
             )
 
     # Test 10l: Ensure duplicate email raises ValueError
+    # Runs the full create_user() path to keep end-to-end coverage of the duplicate check
+    # The raw, un-normalized seed email must still collide, so normalization happens before the check
     # This test checks duplicate emails *only* against active users
     def test_users_test_managers_UserManager_create_user_duplicate_email_fails(self):
-        with self.assertRaises(ValueError, msg="Expected ValueError when creating a user with a duplicate email."):
-            self.user_manager.create_user(
-                email=self.user1.email,  # Duplicate email from setUp()
+        # Only the duplicate-identifier SELECT runs; the INSERT is never attempted
+        with self.assertRaisesMessage(ValueError, "An active user with this email already exists."), \
+                self.assertNumQueries(1, using="users_db"):
+            self.user_manager.create_user(**self._user_kwargs(
+                email=self.seed_raw_email,  # Duplicate of seed_user's email from setUpTestData()
                 username="duplicateuser",
-                password=None,
-                first_name="John",
-                last_name="Doe",
-                organization_id=self.organization1.id,
-                site_id=self.site1.id,
-            )
+            ))
+
+    # Test 10r: Ensure a duplicate passed with a different Python type (int badge vs stored string) still raises ValueError
+    def test_users_test_managers_UserManager_create_user_duplicate_non_string_badge_fails(self):
+        self.users_qs.create(email="numericbadge@example.com", badge_barcode="12345", password=_TEST_PASSWORD_HASH)
+
+        with self.assertRaisesMessage(ValueError, "An active user with this badge barcode already exists."):
+            self.user_manager.create_user(**self._user_kwargs(
+                email="numericbadgedup@example.com",
+                badge_barcode=12345,  # Same value as the stored "12345", passed as an int
+            ))
+
+    # Test 10s: Ensure a badge-only user can be created while an active user already has a NULL username
+    # Identifiers that were not provided are not compared, so NULL never counts as a duplicate
+    def test_users_test_managers_UserManager_create_user_badge_only_ignores_null_username(self):
+        self.users_qs.create(email="nullusername@example.com", badge_barcode="BARCODENULL1", password=_TEST_PASSWORD_HASH)
+
+        user, _ = self.user_manager.create_user(**self._user_kwargs(
+            email="badgeonly@example.com",
+            username=None,
+            badge_barcode="BARCODENULL2",
+        ))
+
+        self.assertIsNone(user.username, "Badge-only user should be saved without a username.")
 
     # Test 10m: Ensure a user can be created with all unique identifiers
     def test_UserManager_create_user_with_all_unique_identifiers(self):
-        user, _  = self.user_manager.create_user(
+        user, _  = self.user_manager.create_user(**self._user_kwargs(
             email="multiiduser@example.com",
             username="multiiduser",
-            password=None,
-            first_name="Alex",
-            last_name="Smith",
-            organization_id=self.organization1.id,
-            site_id=self.site1.id,
-            created_by_id=None,
             badge_barcode="BARCODE99999",
             badge_rfid="RFID99999",
-        )
-
-        # Refresh from the database to confirm it was saved
-        # If user was not saved in db, calling "refresh_from_db()" will raise "User.DoesNotExist" error.
-        user.refresh_from_db()
+        ))
 
         self.assertIsInstance(user, User, "User creation failed when using all unique identifiers.")
 
+        # Confirm it was saved with a cheap EXISTS query rather than reloading the whole row
+        self.assertTrue(
+            self.users_qs.filter(pk=user.pk).exists(),
+            "User created with all unique identifiers was not saved to the database.",
+        )
+
     """
     Tests the create_user() method behavior when creating inactive users 
         with duplicate identifiers.
@@ -956,73 +601,49 @@ class UserModelTests(TestCase):
 
     # Test 10n_1: Ensure an inactive user can have a duplicate email
     def test_UserManager_inactive_user_can_have_duplicate_email(self):
-        inactive_user, _  = self.user_manager.create_user(
+        inactive_user, _  = self.user_manager.create_user(**self._user_kwargs(
             email=self.user2.email,  # Duplicate email from existing inactive user
             username="newinactiveuser",
-            password=None,
-            first_name="Test",
-            last_name="User",
-            organization_id=self.organization1.id,
-            site_id=self.site1.id,
-            created_by_id=None,
             badge_barcode="NEWBARCODE",
             badge_rfid="NEWRFID",
             is_active=False,  # New inactive user
-        )
+        ))
 
         self.assertIsInstance(inactive_user, User, "Inactive user should be allowed to have a duplicate email.")
 
     # Test 10n_2: Ensure an inactive user can have a duplicate username
     def test_UserManager_inactive_user_can_have_duplicate_username(self):
-        inactive_user, _  = self.user_manager.create_user(
+        inactive_user, _  = self.user_manager.create_user(**self._user_kwargs(
             email="newinactive@example.com",
             username=self.user2.username,  # Duplicate username from existing inactive user
-            password=None,
-            first_name="Test",
-            last_name="User",
-            organization_id=self.organization1.id,
-            site_id=self.site1.id,
-            created_by_id=None,
             badge_barcode="NEWBARCODE",
             badge_rfid="NEWRFID",
             is_active=False,  # New inactive user
-        )
+        ))
 
         self.assertIsInstance(inactive_user, User, "Inactive user should be allowed to have a duplicate username.")
 
     # Test 10n_3: Ensure an inactive user can have a duplicate badge_barcode
     def test_UserManager_inactive_user_can_have_duplicate_badge_barcode(self):
-        inactive_user, _  = self.user_manager.create_user(
+        inactive_user, _  = self.user_manager.create_user(**self._user_kwargs(
             email="newinactive@example.com",
             username="newinactiveuser",
-            password=None,
-            first_name="Test",
-            last_name="User",
-            organization_id=self.organization1.id,
-            site_id=self.site1.id,
-            created_by_id=None,
             badge_barcode=self.user2.badge_barcode,  # Duplicate badge_barcode from existing inactive user
             badge_rfid="NEWRFID",
             is_active=False,  # New inactive user
-        )
+        ))
 
         self.assertIsInstance(inactive_user, User, "Inactive user should be allowed to have a duplicate badge_barcode.")
 
     # Test 10n_4: Ensure an inactive user can have a duplicate badge_rfid
     def test_UserManager_inactive_user_can_have_duplicate_badge_rfid(self):
-        inactive_user, _  = self.user_manager.create_user(
+        inactive_user, _  = self.user_manager.create_user(**self._user_kwargs(
             email="newinactive@example.com",
             username="newinactiveuser",
-            password=None,
-            first_name="Test",
-            last_name="User",
-            organization_id=self.organization1.id,
-            site_id=self.site1.id,
-            created_by_id=None,
             badge_barcode="NEWBARCODE",
             badge_rfid=self.user2.badge_rfid,  # Duplicate badge_rfid from existing inactive user
             is_active=False,  # New inactive user
-        )
+        ))
 
         self.assertIsInstance(inactive_user, User, "Inactive user should be allowed to have a duplicate badge_rfid.")
 
@@ -1060,6 +681,8 @@ class UserModelTests(TestCase):
                 - The user's badge RFID.
                 - The temporary password extracted from the email content.
 
+    All of these tests read the single user and email created in `setUpTestData()`.
+
     Guarantees the create_user() method reliably handles email notifications, 
         preserves user credential accuracy, and provides all necessary login information 
         for the user in the email body.
@@ -1067,169 +690,42 @@ class UserModelTests(TestCase):
 
     # Test 10o_1: Ensure an email is sent after user creation
     def test_UserManager_create_user_sends_email(self):
-    
-        self.user_manager.create_user(
-            email="emailtest@example.com",
-            username="emailtestuser",
-            password=None,
-            first_name="Test",
-            last_name="User",
-            organization_id=self.organization1.id,
-            site_id=self.site1.id,
-            created_by_id=None,
-            badge_barcode="BARCODEEMAILTEST",
-            badge_rfid="RFIDEMAILTEST",
-        )
-
-        self.assertEqual(len(mail.outbox), 1, "No email was sent after user creation.")
+        self.assertTrue(self.email_sent, "create_user() did not report the email as sent.")
+        self.assertEqual(self.email_count, 1, "No email was sent after user creation.")
 
     # Test 10o_2: Ensure email is sent to the correct recipient
     def test_UserManager_create_user_email_recipient_is_correct(self):
-    
-        user, _  = self.user_manager.create_user(
-            email="emailtest@example.com",
-            username="emailtestuser",
-            password=None,
-            first_name="Test",
-            last_name="User",
-            organization_id=self.organization1.id,
-            site_id=self.site1.id,
-            created_by_id=None,
-            badge_barcode="BARCODEEMAILTEST",
-            badge_rfid="RFIDEMAILTEST",
-        )
-
-        sent_email = mail.outbox[0]
-
-        self.assertEqual(sent_email.to, [user.email], "Email was not sent to the correct recipient.")
+        self.assertEqual(self.sent_email.to, [self.email_user.email], "Email was not sent to the correct recipient.")
 
     # Test 10o_3: Ensure email subject is correct
     def test_UserManager_create_user_email_subject_is_correct(self):
-    
-        self.user_manager.create_user(
-            email="emailtest@example.com",
-            username="emailtestuser",
-            password=None,
-            first_name="Test",
-            last_name="User",
-            organization_id=self.organization1.id,
-            site_id=self.site1.id,
-            created_by_id=None,
-            badge_barcode="BARCODEEMAILTEST",
-            badge_rfid="RFIDEMAILTEST",
-        )
-
-        sent_email = mail.outbox[0]
-
-        self.assertEqual(sent_email.subject, "Your Account Credentials", "Email subject does not match.")
-
-    # Test 10o_4_1: Ensure email contains the correct email address
-    def test_UserManager_create_user_email_contains_email(self):
-    
-        user, _  = self.user_manager.create_user(
-            email="emailtest@example.com",
-            username="emailtestuser",
-            password=None,
-            first_name="Test",
-            last_name="User",
-            organization_id=self.organization1.id,
-            site_id=self.site1.id,
-            created_by_id=None,
-            badge_barcode="BARCODEEMAILTEST",
-            badge_rfid="RFIDEMAILTEST",
-        )
-
-        sent_email = mail.outbox[0]
-
-        self.assertIn(f"Email: {user.email}", sent_email.body, "Email missing in email body.")
-
-    # Test 10o_4_2: Ensure email contains the correct username
-    def test_UserManager_create_user_email_contains_username(self):
-    
-        user, _  = self.user_manager.create_user(
-            email="emailtest@example.com",
-            username="emailtestuser",
-            password=None,
-            first_name="Test",
-            last_name="User",
-            organization_id=self.organization1.id,
-            site_id=self.site1.id,
-            created_by_id=None,
-            badge_barcode="BARCODEEMAILTEST",
-            badge_rfid="RFIDEMAILTEST",
-        )
-
-        sent_email = mail.outbox[0]
-
-        self.assertIn(f"Username: {user.username}", sent_email.body, "Username missing in email body.")
-
-    # Test 10o_4_3: Ensure email contains the correct badge barcode
-    def test_UserManager_create_user_email_contains_badge_barcode(self):
-    
-        user, _  = self.user_manager.create_user(
-            email="emailtest@example.com",
-            username="emailtestuser",
-            password=None,
-            first_name="Test",
-            last_name="User",
-            organization_id=self.organization1.id,
-            site_id=self.site1.id,
-            created_by_id=None,
-            badge_barcode="BARCODEEMAILTEST",
-            badge_rfid="RFIDEMAILTEST",
-        )
-
-        sent_email = mail.outbox[0]
-
-        self.assertIn(f"Badge Barcode: {user.badge_barcode}", sent_email.body, "Badge Barcode missing in email body.")
-
-    # Test 10o_4_4: Ensure email contains the correct badge RFID
-    def test_UserManager_create_user_email_contains_badge_rfid(self):
-    
-        user, _  = self.user_manager.create_user(
-            email="emailtest@example.com",
-            username="emailtestuser",
-            password=None,
-            first_name="Test",
-            last_name="User",
-            organization_id=self.organization1.id,
-            site_id=self.site1.id,
-            created_by_id=None,
-            badge_barcode="BARCODEEMAILTEST",
-            badge_rfid="RFIDEMAILTEST",
-        )
-
-        sent_email = mail.outbox[0]
-
-        self.assertIn(f"Badge RFID: {user.badge_rfid}", sent_email.body, "Badge RFID missing in email body.")
+        self.assertEqual(self.sent_email.subject, "Your Account Credentials", "Email subject does not match.")
+
+    # Test 10o_4_1 - 10o_4_4: Ensure email contains the user's login identifiers
+    def test_UserManager_create_user_email_contains_login_identifiers(self):
+        for prefix, field in [
+            ("Email", "email"),
+            ("Username", "username"),
+            ("Badge Barcode", "badge_barcode"),
+            ("Badge RFID", "badge_rfid"),
+        ]:
+            with self.subTest(field=field):
+                self.assertIn(
+                    f"{prefix}: {getattr(self.email_user, field)}",
+                    self.sent_email.body,
+                    f"{prefix} missing in email body.",
+                )
 
     # Test 10o_4_5: Ensure the email contains the correct temporary password
     def test_UserManager_create_user_email_contains_temporary_password(self):
 
-        user, _  = self.user_manager.create_user(
-            email="emailtest@example.com",
-            username="emailtestuser",
-            password=None,
-            first_name="Test",
-            last_name="User",
-            organization_id=self.organization1.id,
-            site_id=self.site1.id,
-            created_by_id=None,
-            badge_barcode="BARCODEEMAILTEST",
-            badge_rfid="RFIDEMAILTEST",
-        )
-
-        sent_email = mail.outbox[0]
-
         # Extract the actual password from the email body, since we do not want to have a non hashed password outside of the create_user method
-        email_lines = sent_email.body.split("\n")
-        plaintext_password = None
-        for line in email_lines:
-            if "Temporary Password:" in line:
-                plaintext_password = line.replace("Temporary Password:", "").strip()
-                break
+        match = _TEMP_PW_RE.search(self.sent_email.body)
+        self.assertIsNotNone(match, "Temporary Password missing in email body.")
+        plaintext_password = match.group(1).strip()
 
-        self.assertIn(f"Temporary Password: {plaintext_password}", sent_email.body, "Temporary Password missing in email body.")
+        self.assertTrue(plaintext_password, "Temporary Password missing in email body.")
+        self.assertTrue(self.email_user.check_password(plaintext_password), "Emailed password does not match the stored hash.")
 
     """
     Tests the create_user() method's behavior when email delivery fails.
@@ -1260,41 +756,29 @@ class UserModelTests(TestCase):
     """
 
     #Test 10p_1: Ensure create_user does not raise an error when email fails
-    @patch("django.core.mail.send_mail", side_effect=smtplib.SMTPException("Simulated email failure"))
+    @patch("users.managers.send_mail", side_effect=smtplib.SMTPException("Simulated email failure"))
     def test_UserManager_create_user_handles_email_failure_gracefully(self, mock_send_mail):
     
         try:
-            user, email_sent = self.user_manager.create_user(
+            user, email_sent = self.user_manager.create_user(**self._user_kwargs(
                 email="failedemail@example.com",
                 username="emailfailtest",
-                password=None,
-                first_name="Test",
-                last_name="User",
-                organization_id=self.organization1.id,
-                site_id=self.site1.id,
-                created_by_id=None,
                 badge_barcode="BARCODEEMAILFAIL",
                 badge_rfid="RFIDEMAILFAIL",
-            )
+            ))
         except Exception as e:
             self.fail(f"create_user() raised an exception when email failed: {e}")
 
     # Test 10p_2: Ensure create_user still creates a user even when email fails
-    @patch("django.core.mail.send_mail", side_effect=smtplib.SMTPException("Simulated email failure"))
+    @patch("users.managers.send_mail", side_effect=smtplib.SMTPException("Simulated email failure"))
     def test_UserManager_create_user_creates_user_even_when_email_fails(self, mock_send_mail):
     
-        user, email_sent = self.user_manager.create_user(
+        user, email_sent = self.user_manager.create_user(**self._user_kwargs(
             email="failedemail@example.com",
             username="emailfailtest",
-            password=None,
-            first_name="Test",
-            last_name="User",
-            organization_id=self.organization1.id,
-            site_id=self.site1.id,
-            created_by_id=None,
             badge_barcode="BARCODEEMAILFAIL",
             badge_rfid="RFIDEMAILFAIL",
-        )
+        ))
 
 
         self.assertIsInstance(user, User, "User was not created when email failed.")
@@ -1303,36 +787,232 @@ class UserModelTests(TestCase):
     # Test 10p_3: Ensure email_sent is False when email fails
     def test_UserManager_create_user_email_sent_flag_is_false_on_failure(self,mock_send_mail):
 
-        user, email_sent = self.user_manager.create_user(
+        user, email_sent = self.user_manager.create_user(**self._user_kwargs(
             email="failedemail@example.com",
             username="emailfailtest",
-            password=None,
-            first_name="Test",
-            last_name="User",
-            organization_id=self.organization1.id,
-            site_id=self.site1.id,
-            created_by_id=None,
             badge_barcode="BARCODEEMAILFAIL",
             badge_rfid="RFIDEMAILFAIL",
-        )
+        ))
 
         self.assertFalse(email_sent, "email_sent should be False when email sending fails.")
 
     # Test 10q: Ensure ValueError is raised if blank password is provided
     def test_UserManager_create_user_raises_error_on_blank_password(self):
 
-        with self.assertRaises(ValueError) as context:
-            self.user_manager.create_user(
+        # The blank password is rejected before the duplicate-identifier query runs
+        with self.assertRaisesMessage(ValueError, "A valid password must be set and cannot be blank."), \
+                self.assertNumQueries(0, using="users_db"):
+            self.user_manager.create_user(**self._user_kwargs(
                 email="blankpassword@example.com",
                 username="blankpassuser",
                 password="",  # Explicitly passing blank
-                first_name="Test",
-                last_name="User",
-                organization_id=self.organization1.id,
-                site_id=self.site1.id,
-                created_by_id=None,
                 badge_barcode="BARCODEBLANK",
                 badge_rfid="RFIDBLANK",
-            )
+            ))
+
+
+class UserManagerUpdateUserTests(UsersDatabaseMixin, TestCase):
+    """
+    Tests the update_user() method's handling of a username change.
+
+    Purpose:
+        - Ensures update_user() returns the user with the new, unused username applied.
+        - Ensures, in one dedicated test, that the change is actually saved to `users_db`.
+        - Ensures a username held by another active user is rejected, while unset badges never count as conflicts.
+
+    Expected Behavior:
+        - The returned instance carries the requested username; no extra SELECT is needed to check it.
+        - Reloading the row shows the same username; verification loads only the `username` column.
+        - A clash raises `ValueError` naming the username.
+    """
+
+    """
+    Creates only the rows the update_user() tests rely on.
+
+    Purpose:
+        - `user1` is the user being updated; `user2` records who modified it.
+        - `no_badge_user` is active with no badges, so a conflict query that compared unset
+            badges (`badge_barcode IS NULL`) would wrongly match it on every update.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+
+        _, _, (cls.user1, cls.user2) = _seed_fixtures(organizations=1, sites=1, users=2)
+        cls.no_badge_user = cls.users_qs.create(
+            email="nobadge@example.com",
+            username="nobadgeuser",
+            password=_TEST_PASSWORD_HASH,
+        )
+
+    # Test 11a: Ensure update_user returns the user with the new username
+    def test_users_test_managers_UserManager_update_user_username_success(self):
+        updated_user = self.user_manager.update_user(user_id=self.user1.id, username="useronerenamed", modified_by_id=self.user2.id)
+
+        self.assertEqual(updated_user.username, "useronerenamed", "update_user() did not apply the new username.")
+
+    # Test 11b: Ensure update_user persists its changes to users_db
+    def test_users_test_managers_UserManager_update_user_persists_to_db(self):
+        self.user_manager.update_user(user_id=self.user1.id, username="useronerenamed", modified_by_id=self.user2.id)
+
+        stored_user = self.users_qs.only("username").get(id=self.user1.id)
+        self.assertEqual(stored_user.username, "useronerenamed", "update_user() did not save the new username.")
+
+    # Test 11c: Ensure update_user rejects a username already held by another active user
+    def test_users_test_managers_UserManager_update_user_duplicate_username_fails(self):
+        with self.assertRaisesMessage(ValueError, "An active user with this username already exists."):
+            self.user_manager.update_user(user_id=self.user1.id, username=self.no_badge_user.username)
+
+
+class UserManagerPureTests(SimpleTestCase):
+    """
+    UserManager helpers that never touch the database.
+
+    Purpose:
+        - Groups the normalize_email() and generate_secure_password() tests, which only need a manager instance.
+        - Holds the create_user() checks that must fail before any query; `SimpleTestCase` rejects
+            database access, so a regression that reaches the ORM fails the test.
+        - Runs them under `SimpleTestCase`, so no fixtures are created and no transactions or savepoints are opened.
+    """
+
+    # UserManager is stateless, so one shared instance serves every test.
+    user_manager = UserManager()
+
+
+    """
+    Tests normalize_email() in UserManager to ensure proper email formatting and error handling.
+
+    Purpose:
+        - Ensures email addresses are correctly formatted before being saved.
+        - Confirms normalization handles case sensitivity and whitespace.
+        - Validates that invalid email formats raise a `ValueError`.
+
+    Expected Behavior:
+        - Converts uppercase letters to lowercase.
+        - Strips leading and trailing whitespace.
+        - Returns `None` when given `None` as input.
+        - Raises a `ValueError` when given an invalid email format.
+
+    Test Cases (Grouped under Test 8):
+        8a. **Uppercase Letters** → Converts "USER@Example.COM" to "user@example.com".
+        8b. **Leading & Trailing Spaces** → Strips spaces from "  user@example.com  ".
+        8c. **Mixed-Case Email** → Normalizes "MiXEDcAsE@DOMAIN.CoM" to "mixedcase@domain.com".
+        8d. **None Input** → Returns `None` without raising an error.
+        8e. **Invalid Email Format** → Raises `ValueError` for malformed emails (e.g., "INVALID EMAIL@EXAMPLE.COM").
+    Each case runs as a subTest of a single method.
+
+    Guarantees that email normalization works correctly before storing user data.
+    """
+
+    # Test 8a-8e: Ensure emails are lowercased and stripped, None passes through, and invalid formats raise
+    def test_users_test_managers_UserManager_normalize_email(self):
+        for case, raw_email, expected_email in [
+            ("8a_uppercase", "  USER@Example.COM  ", "user@example.com"),
+            ("8b_leading_trailing_spaces", "  user@example.com  ", "user@example.com"),
+            ("8c_mixed_case", "MiXEDcAsE@DOMAIN.CoM", "mixedcase@domain.com"),
+            ("8d_none_input", None, None),
+        ]:
+            with self.subTest(case=case):
+                self.assertEqual(self.user_manager.normalize_email(raw_email), expected_email, f"Email normalization failed for {raw_email!r}.")
+
+        with self.subTest(case="8e_invalid_format"):
+            with self.assertRaises(ValueError, msg="normalize_email() should raise ValueError for an invalid email format."):
+                self.user_manager.normalize_email("INVALID EMAIL@EXAMPLE.COM")
+
+    """
+    Tests generate_secure_password() to ensure strong password generation.
+
+    Purpose:
+        - Confirms that generated passwords meet security and complexity requirements.
+        - Ensures that passwords contain all required character types.
+        - Validates that passwords are unique across multiple generations.
+        - Ensures the function raises an error when attempting to generate a password below the minimum length.
+
+    Expected Behavior:
+        - Generates passwords with a minimum length of 16 characters.
+        - Each password contains at least one uppercase letter, one lowercase letter, one digit, and one special character.
+        - Passwords are randomly generated and unique.
+        - Raises a `ValueError` if a password shorter than 16 characters is requested.
+
+    Test Cases:
+        9a. **Default Password Length (16)** → Confirms generated password meets minimum length.
+        9b. **Custom Password Length (20)** → Ensures requested length is respected.
+        9c. **Password Character Validation** (checked with subTests against the 9a password):
+            1. Must contain at least one uppercase letter.
+            2. Must contain at least one lowercase letter.
+            3. Must contain at least one digit.
+            4. Must contain at least one special character.
+        9d. **Password Uniqueness** → Multiple generated passwords should not be identical.
+        9e. **Password Below Minimum Length** → Attempting to generate a password <16 should raise a `ValueError`.
+
+    Guarantees that password generation adheres to security best practices and prevents weak or predictable passwords.
+    """
+
+    
+    # Test 9a/9c: Ensure the default password is 16 characters and meets every complexity rule
+    # One generated password is shared by all sub-checks
+    def test_users_test_managers_UserManager_generate_secure_password_default_and_complexity(self):
+        password = self.user_manager.generate_secure_password()
+
+        with self.subTest(check="default_length"):
+            self.assertEqual(len(password), 16, "Default password length should be 16.")
+        with self.subTest(check="uppercase"):
+            self.assertFalse(_UPPER_SET.isdisjoint(password), "Password missing an uppercase letter.")
+        with self.subTest(check="lowercase"):
+            self.assertFalse(_LOWER_SET.isdisjoint(password), "Password missing a lowercase letter.")
+        with self.subTest(check="digit"):
+            self.assertFalse(_DIGIT_SET.isdisjoint(password), "Password missing a digit.")
+        with self.subTest(check="special_character"):
+            self.assertFalse(_SPECIAL_SET.isdisjoint(password), "Password missing a special character from the approved set.")
+
+    # Test 9b: Ensure custom password length works (20 characters)
+    def test_users_test_managers_UserManager_generate_secure_password_custom_length(self):
+        password = self.user_manager.generate_secure_password(length=20)
+        self.assertEqual(len(password), 20, "Custom password length should be 20.")
+
+    # Test 9d: Ensure generated passwords are unique
+    def test_users_test_managers_UserManager_generate_secure_password_uniqueness(self):
+        password1 = self.user_manager.generate_secure_password()
+        password2 = self.user_manager.generate_secure_password()
+        self.assertNotEqual(password1, password2, "Generated passwords should not be identical.")
+
+    # Test 9e: Ensure attempting to generate a password below 16 characters raises ValueError
+    def test_users_test_managers_UserManager_generate_secure_password_min_length_violation(self):
+
+        with self.assertRaises(ValueError, msg="Password length below 16 should raise a ValueError."):
+            self.user_manager.generate_secure_password(length=12)
+
+    # Test 9f: Raises ValueError if required character sets are empty
+    def test_users_test_managers_UserManager_generate_secure_password_raises_if_charset_missing(self):
+        manager = self.user_manager
+
+        # Make secrets.choice raise IndexError, as it would on an empty character set
+        with swap_secrets_choice(_raise_empty_sequence):
+            with self.assertRaises(ValueError) as context:
+                manager.generate_secure_password()
+            self.assertIn("Character set missing required characters", str(context.exception))
+    
+    # Test 9g: Raises ValueError if final password fails complexity check
+    def test_users_test_managers_UserManager_generate_secure_password_complexity_check_fails(self):
+        manager = self.user_manager
+
+        # Patch secrets.choice and random_chars to force bad password output
+        with swap_secrets_choice(lambda *args, **kwargs: "a"):  # Force lowercase
+            with self.assertRaises(ValueError) as context:
+                manager.generate_secure_password()
+            self.assertIn("Generated password does not meet complexity requirements", str(context.exception))
 
-        self.assertEqual(str(context.exception), "A valid password must be set and cannot be blank.")
\ No newline at end of file
+    # Test 10g/10h: Ensure a missing email or login identifier raises ValueError before the database is touched
+    def test_users_test_managers_UserManager_create_user_missing_required_fields_fail(self):
+        for case, fields, expected_error in [
+            ("10g_missing_email", {"email": None, "username": "testuser_no_email"}, "The Email field must be set."),
+            ("10h_missing_login_identifier", {
+                "email": "identifier_missing@example.com",
+                "username": None,
+                "badge_barcode": None,
+                "badge_rfid": None,
+            }, "At least one additional login identifier (username, badge) must be set."),
+        ]:
+            with self.subTest(case=case):
+                with self.assertRaisesMessage(ValueError, expected_error):
+                    self.user_manager.create_user(**DEFAULT_USER_KWARGS, **fields)
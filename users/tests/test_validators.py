@@ -0,0 +1,55 @@
+from django.core.exceptions import ValidationError
+from django.test import SimpleTestCase
+from users.managers import UserManager
+from users.validators import CustomPasswordValidator
+# https://docs.djangoproject.com/en/5.1/topics/testing/tools/
+
+class CustomPasswordValidatorTests(SimpleTestCase):
+    """
+    Tests CustomPasswordValidator, the project's complexity rule in AUTH_PASSWORD_VALIDATORS.
+
+    Purpose:
+        - Confirms each missing character class is reported with its own error code.
+        - Guards the special-character set against regressions such as the unescaped `-`
+            that once made the range ')'..'_' (every digit and uppercase letter) count as special.
+        - Confirms the help text lists the approved special characters from `UserManager`.
+
+    Expected Behavior:
+        - A password with an uppercase letter, a lowercase letter, an ASCII digit and an approved
+            special character passes.
+        - Otherwise a `ValidationError` is raised with the code of the first missing class.
+
+    Runs under `SimpleTestCase`, since the validator never touches the database.
+    """
+
+    validator = CustomPasswordValidator()
+
+    # Test 1: Ensure a password with every required character class passes
+    def test_users_test_validators_CustomPasswordValidator_valid_password_passes(self):
+        try:
+            self.validator.validate("Abcdefg1-")
+        except ValidationError as e:
+            self.fail(f"validate() rejected a compliant password: {e.messages}")
+
+    # Test 2-7: Ensure each missing character class raises its own error code
+    def test_users_test_validators_CustomPasswordValidator_missing_class_error_codes(self):
+        for case, password, expected_code in [
+            ("no_uppercase", "abcdefg1-", "password_no_upper"),
+            ("no_lowercase", "ABCDEFG1-", "password_no_lower"),
+            ("no_digit", "Abcdefgh-", "password_no_digit"),
+            ("no_special", "Abcdefg12", "password_no_special"),
+            # An uppercase letter and a digit fall inside ')'..'_', so this passed while '-' was unescaped
+            ("hyphen_range_not_special", "Abcdefg1A", "password_no_special"),
+            # Only ASCII digits count; ARABIC-INDIC DIGIT THREE does not
+            ("non_ascii_digit", "Abcdefg٣-", "password_no_digit"),
+        ]:
+            with self.subTest(case=case):
+                with self.assertRaises(ValidationError) as context:
+                    self.validator.validate(password)
+                self.assertEqual(context.exception.code, expected_code)
+
+    # Test 8: Ensure the help text lists every approved special character
+    def test_users_test_validators_CustomPasswordValidator_help_text_lists_special_characters(self):
+        help_text = self.validator.get_help_text()
+
+        self.assertIn("(" + " ".join(UserManager.SPECIAL_CHARACTERS) + ")", help_text)
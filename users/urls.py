@@ -1,7 +1,10 @@
-print("DEBUG: Starting to load URLs for users app...")
+import logging
 from django.urls import path
 from . import views
 
+logger = logging.getLogger(__name__)
+logger.debug("Starting to load URLs for users app...")
+
 app_name = 'users'
 urlpatterns = []
 
@@ -10,4 +13,4 @@ urlpatterns = []
 #     path('admin/users/', views.user_management, name='user_management'),
 # ]
 
-print("DEBUG: Finished loading URLs for users app.")
\ No newline at end of file
+logger.debug("Finished loading URLs for users app.")
\ No newline at end of file
@@ -1,6 +1,31 @@
-import re
+import string
+from functools import lru_cache
 from django.core.exceptions import ValidationError
-from django.utils.translation import gettext as _
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.translation import get_language, gettext as _
+from .managers import UserManager
+
+# Required character classes, built once at import; validate() tests each against the password's characters
+UPPERCASE_CHARACTERS = frozenset(string.ascii_uppercase)
+LOWERCASE_CHARACTERS = frozenset(string.ascii_lowercase)
+DIGIT_CHARACTERS = frozenset(string.digits)
+# The approved special characters are defined once, on UserManager, and shared with password generation
+SPECIAL_CHARACTERS = frozenset(UserManager.SPECIAL_CHARACTERS)
+
+# Translated help text, looked up once per active language
+@lru_cache(maxsize=16)
+def _help_text(language):
+    return _(
+        "Your password must contain at least one uppercase letter, one lowercase letter, one digit, and "
+        "one special character (%(special_characters)s)"
+    ) % {"special_characters": " ".join(UserManager.SPECIAL_CHARACTERS)}
+
+# Tests that change the language settings must not see text cached for the old ones
+@receiver(setting_changed)
+def _clear_help_text_cache(setting, **kwargs):
+    if setting in {"LANGUAGES", "LANGUAGE_CODE", "LOCALE_PATHS"}:
+        _help_text.cache_clear()
 
 class CustomPasswordValidator:
     """
@@ -13,18 +38,17 @@ class CustomPasswordValidator:
     
     def validate(self, password, user=None):
         """Checks if the password meets the complexity requirements."""
-        if not re.search(r'[A-Z]', password):
+        # One pass over the password; each check below is then a set intersection test
+        characters = frozenset(password)
+        if UPPERCASE_CHARACTERS.isdisjoint(characters):
             raise ValidationError(_("Password must contain at least one uppercase letter."), code='password_no_upper')
-        if not re.search(r'[a-z]', password):
+        if LOWERCASE_CHARACTERS.isdisjoint(characters):
             raise ValidationError(_("Password must contain at least one lowercase letter."), code='password_no_lower')
-        if not re.search(r'\d', password):
+        if DIGIT_CHARACTERS.isdisjoint(characters):
             raise ValidationError(_("Password must contain at least one digit."), code='password_no_digit')
-        if not re.search(r'[@#$%^&*()-_+=]', password):
+        if SPECIAL_CHARACTERS.isdisjoint(characters):
             raise ValidationError(_("Password must contain at least one special character."), code='password_no_special')
 
     def get_help_text(self):
         """Returns a description of the password rules."""
-        return _(
-            "Your password must contain at least one uppercase letter, one lowercase letter, one digit, and "
-            "one special character (@ # $ % ^ & * ( ) - _ + =)"
-        )
+        return _help_text(get_language())
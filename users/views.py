@@ -1,11 +1,18 @@
 # print("DEBUG: Starting to load views for users app...")
 # from django.shortcuts import render, redirect
+# from django.core.paginator import Paginator
 # from django.http import JsonResponse
 # from users.authentication import generate_session
 # from users.authentication import custom_login_required
+# from users.authentication import get_cached_user
 # from django.views.decorators.csrf import csrf_exempt
+# from django.views.decorators.cache import cache_control
+# from django.views.decorators.http import condition
+# from django.views.decorators.vary import vary_on_cookie
 # from .forms import CustomUserChangeForm
 # from .models import User
+# from organizations.models import Organization
+# from sites.models import Site
 
 
 # # Disable CSRF for simplicity (should be replaced with secure handling)
@@ -18,39 +25,82 @@
 #     password = request.POST.get("password")
 
 #     try:
-#         user = User.objects.get(email=email)
+#         # Email is unique among active users (unique_active_email), so this is a single index probe
+#         # returning at most one row; only the columns needed to log in are loaded
+#         user = User.objects.using("users_db").only('id', 'password').get(email=email, is_active=True)
 #         if user.check_password(password):  # Ensure user model has password checking
 #             session_id = generate_session(user.id)  # Generate Redis session
 #             response = JsonResponse({"message": "Login successful"})
 #             response.set_cookie("session_id", session_id, httponly=True, max_age=86400)  # Store session ID in cookie
 #             return response
 #     except User.DoesNotExist:
+#         # Hash the submitted password anyway, so unknown emails are not answered faster than wrong passwords
+#         User().set_password(password)
 #         return JsonResponse({"error": "Invalid credentials"}, status=401)
 
 #     return JsonResponse({"error": "Invalid login"}, status=401)
 
+# # Last-Modified for the profile page: the user's own last_modified, read through the user cache.
+# # Only GET is conditional; form submissions are always processed.
+# def user_profile_last_modified(request):
+#     if request.method != 'GET':
+#         return None
+#     return get_cached_user(request.user_id).last_modified
+
 # # Handles user profile updates.
+# # Repeat GETs revalidate against the user's last_modified and get a 304 while the row is unchanged.
+# # The response is private to the browser, varies by the session cookie, and is never reused
+# # without revalidation, so a redirect after a save never shows the old profile.
 # @custom_login_required
+# @condition(last_modified_func=user_profile_last_modified)
+# @cache_control(private=True, no_cache=True)
+# @vary_on_cookie
 # def user_profile(request):
 
-#     user = User.objects.get(id=request.user_id)  # Retrieve user from Redis session
-
 #     if request.method == 'POST':
+#         # Saves always start from the stored row, never a cached copy
+#         user = User.objects.using("users_db").get(pk=request.user_id)
 #         form = CustomUserChangeForm(request.POST, instance=user)
 #         if form.is_valid():
-#             form.save()
+#             # Write back only the columns the user changed; last_modified is auto_now, so it is listed explicitly
+#             user = form.save(commit=False)
+#             if form.has_changed():
+#                 user.save(using="users_db", update_fields=[*form.changed_data, 'last_modified'])
 #             return redirect('users:user_profile')
 #     else:
+#         user = get_cached_user(request.user_id)  # Retrieve user from Redis cache, falling back to users_db
 #         form = CustomUserChangeForm(instance=user)
 
 #     return render(request, 'users/user_profile.html', {'form': form})
 
 
+# # Number of users listed per page on the user management dashboard
+# USER_MANAGEMENT_PAGE_SIZE = 50
+
 # # Displays user management dashboard.
+# # Only one page of users is loaded per request, and only the columns the list renders.
 # @custom_login_required
 # def user_management(request):
 
-#     users = User.objects.all()
-#     return render(request, 'users/user_management.html', {'users': users})
+#     # Plain dicts: the list is read-only, so no User instances need to be built
+#     users = User.objects.using("users_db").values(
+#         'id', 'email', 'first_name', 'last_name', 'is_active', 'is_staff', 'organization_id', 'site_id'
+#     ).order_by('-date_joined')
+#     page_obj = Paginator(users, USER_MANAGEMENT_PAGE_SIZE).get_page(request.GET.get('page'))
+
+#     # Organizations and sites live in other databases, so select_related() cannot join them.
+#     # Fetch the names for the whole page in one query per database instead of
+#     # calling get_organization()/get_site() for each row.
+#     organization_ids = {user['organization_id'] for user in page_obj if user['organization_id']}
+#     site_ids = {user['site_id'] for user in page_obj if user['site_id']}
+#     organization_names = dict(
+#         Organization.objects.using("organizations_db").filter(id__in=organization_ids).values_list('id', 'name')
+#     )
+#     site_names = dict(Site.objects.using("sites_db").filter(id__in=site_ids).values_list('id', 'name'))
+#     for user in page_obj:
+#         user['organization_name'] = organization_names.get(user['organization_id'])
+#         user['site_name'] = site_names.get(user['site_id'])
+
+#     return render(request, 'users/user_management.html', {'page_obj': page_obj})
 
 # print("DEBUG: Finished loading views for users app.")